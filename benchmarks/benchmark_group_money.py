@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+""" Benchmark Module for comparing the transition step of the wallet grouping
+
+The dynamic programming layer is advanced over a random wallet once with the
+state by state loop and once with the array operations, and the time taken by
+both along with the speedup is printed. It is run from the repository root as:
+    python -m benchmarks.benchmark_group_money --sizes 1000 10000 100000
+
+This script requires the following modules be installed in the python environment
+    * numpy - to generate the random wallets
+    * time - to time the runs
+    * argparse - to read the wallet sizes
+
+This script contains the following function
+    * get_input_arguments - to get the wallet sizes from command line
+    * time_transitions - times one transition step over a whole wallet
+    * main - main function to run the benchmark
+"""
+
+# Built-In Imports
+import argparse
+import time
+
+import numpy as np
+
+# User Imports
+from solutions.wallet.group_money import DENOMINATIONS, advance_layer, advance_layer_loop
+
+__author__ = "praveen@gyandata.com"
+
+
+def get_input_arguments():
+    """
+    Function to get the input arguments from command line
+    :return: args - arguments from the command line
+    :rtype: argparse.Namespace
+    """
+
+    my_parser = argparse.ArgumentParser(allow_abbrev=False)
+    my_parser.add_argument('--sizes', action='store', type=int, nargs='+',
+                           default=[1000, 10000, 100000])
+    my_parser.add_argument('--seed', action='store', type=int, default=0)
+
+    args = my_parser.parse_args()
+    return args
+
+
+def time_transitions(transition, notes_array):
+    """
+    Function to time a transition step over all the notes of a wallet
+    :param transition: advance_layer or advance_layer_loop
+    :type transition: function
+    :param notes_array: The bit position of each note
+    :type notes_array: numpy.ndarray
+    :return: elapsed time in seconds and the number of notes kept in place
+    :rtype: tuple
+    """
+
+    shape = (1 << len(DENOMINATIONS), len(DENOMINATIONS))
+    current_layer = np.zeros(shape, dtype=np.int64)
+    next_layer = np.zeros(shape, dtype=np.int64)
+
+    start = time.perf_counter()
+    for note in notes_array:
+        transition(current_layer, next_layer, note)
+        current_layer, next_layer = next_layer, current_layer
+    elapsed = time.perf_counter() - start
+    return elapsed, int(current_layer.max())
+
+
+def main():
+    """
+    Main function to run the benchmark
+    :return: Nothing
+    :rtype: None
+    """
+    arguments = get_input_arguments()
+    generator = np.random.default_rng(arguments.seed)
+
+    print("{:>10} {:>12} {:>12} {:>10}".format("notes", "loop (s)", "array (s)", "speedup"))
+    for size in arguments.sizes:
+        notes_array = generator.integers(0, len(DENOMINATIONS), size)
+        loop_time, loop_kept = time_transitions(advance_layer_loop, notes_array)
+        array_time, array_kept = time_transitions(advance_layer, notes_array)
+        if loop_kept != array_kept:
+            raise RuntimeError("The transition steps disagree for %s notes" % size)
+        print("{:>10} {:>12.3f} {:>12.3f} {:>9.1f}x".format(size, loop_time, array_time,
+                                                           loop_time / array_time))
+
+
+if __name__ == '__main__':
+    main()
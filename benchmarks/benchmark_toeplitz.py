@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+""" Benchmark Module for comparing the ways of generating a toeplitz matrix
+
+A square toeplitz matrix is generated as a list of rows, as a strided view and
+as a contiguous array, and the time taken and the memory held by each is
+printed. It is run from the repository root as:
+    python -m benchmarks.benchmark_toeplitz --sizes 1000 2000 4000
+
+This script requires the following modules be installed in the python environment
+    * numpy - to check the generated matrices
+    * time - to time the runs
+    * argparse - to read the matrix sizes
+
+This script contains the following function
+    * get_input_arguments - to get the matrix sizes from command line
+    * time_generation - times the generation of a matrix in one output mode
+    * main - main function to run the benchmark
+"""
+
+# Built-In Imports
+import argparse
+import sys
+import time
+
+import numpy as np
+
+# User Imports
+from solutions.toeplitz.generate_matrix import generate_toeplitz_matrix
+
+__author__ = "praveen@gyandata.com"
+
+
+def get_input_arguments():
+    """
+    Function to get the input arguments from command line
+    :return: args - arguments from the command line
+    :rtype: argparse.Namespace
+    """
+
+    my_parser = argparse.ArgumentParser(allow_abbrev=False)
+    my_parser.add_argument('--sizes', action='store', type=int, nargs='+',
+                           default=[1000, 2000, 4000])
+
+    args = my_parser.parse_args()
+    return args
+
+
+def time_generation(size, output):
+    """
+    Function to time the generation of a size x size toeplitz matrix
+    :param size: The number of rows and columns
+    :type size: int
+    :param output: The output mode of generate_toeplitz_matrix
+    :type output: str
+    :return: elapsed time in seconds, the bytes held by the matrix and the matrix
+    :rtype: tuple
+    """
+
+    rows = list(range(1, size + 1))
+    columns = list(range(1, 2 * size, 2))
+
+    start = time.perf_counter()
+    matrix = generate_toeplitz_matrix(rows, columns, output=output)
+    elapsed = time.perf_counter() - start
+
+    if output == "list":
+        # The rows share no lists, but the integers are shared with the first row and column
+        memory = sys.getsizeof(matrix) + sum(map(sys.getsizeof, matrix))
+    elif output == "view":
+        # The view holds only the buffer it is taken over
+        buffer = matrix
+        while buffer.base is not None:
+            buffer = buffer.base
+        memory = buffer.nbytes
+    else:
+        memory = matrix.nbytes
+    return elapsed, memory, matrix
+
+
+def main():
+    """
+    Main function to run the benchmark
+    :return: Nothing
+    :rtype: None
+    """
+    arguments = get_input_arguments()
+
+    print("{:>8} {:>8} {:>12} {:>14} {:>10}".format("size", "output", "time (s)", "memory (KiB)",
+                                                    "speedup"))
+    for size in arguments.sizes:
+        list_time, _, list_matrix = time_generation(size, "list")
+        for output in ("list", "view", "array"):
+            elapsed, memory, matrix = time_generation(size, output)
+            if output != "list" and not np.array_equal(matrix, list_matrix):
+                raise RuntimeError("The %s output disagrees for size %s" % (output, size))
+            print("{:>8} {:>8} {:>12.4f} {:>14.1f} {:>9.1f}x".format(size, output, elapsed,
+                                                                    memory / 1024,
+                                                                    list_time / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,7 @@ import argparse
 
 # User Imports
 from solutions.orthogonalization.gram_schmidt import orthogonalize_vectors
+from solutions.orthogonalization.tsqr import orthogonalize_memmap
 
 __author__ = "praveen@gyandata.com"
 
@@ -33,6 +34,8 @@ def get_input_arguments():
     my_parser = argparse.ArgumentParser(allow_abbrev=False)
     my_parser.add_argument('--logfile', action='store', type=str, required=True)
     my_parser.add_argument('--inputfile', action='store', type=str, required=True)
+    my_parser.add_argument('--outputfile', action='store', type=str, required=False)
+    my_parser.add_argument('--blockrows', action='store', type=int, default=1 << 16)
 
     args = my_parser.parse_args()
     return args
@@ -76,6 +79,15 @@ def main():
     arguments = get_input_arguments()
     configure_logging(arguments.logfile)
 
+    if arguments.inputfile.endswith(".npy"):
+        # A .npy file has the vectors as its columns, and is orthogonalized
+        # Block by block into the output file without loading it
+        if not arguments.outputfile:
+            LOGGER.error("The outputfile is needed for a .npy inputfile")
+            return
+        orthogonalize_memmap(arguments.inputfile, arguments.outputfile, arguments.blockrows)
+        return
+
     vectors = get_input_data(arguments.inputfile)
 
     orthogonalized_vectors = orthogonalize_vectors(vectors)
@@ -16,7 +16,7 @@ import logging.config
 import json
 
 # User Imports
-from solutions.wallet.group_money import find_number_of_transition
+from solutions.wallet.group_money import find_number_of_transition, find_arrangement
 
 __author__ = "praveen@gyandata.com"
 
@@ -44,6 +44,7 @@ def main():
 
     wallet = [100, 200, 200, 500, 100, 100, 500, 100, 100]
     find_number_of_transition(wallet)
+    find_arrangement(wallet)
     LOGGER.info("Done")
 
 
@@ -1,27 +1,47 @@
 # -*- coding: utf-8 -*-
-""" Main Module for checking if the rows could be piled up
+""" Main Module for finding the distinct prime factors of the product of integers
 
 This script requires the following modules be installed in the python environment
     * logging - to perform logging operations
     * json - to load json files
 
 This script contains the following function
+    * get_positive_integer - to read a positive integer argument
+    * get_input_arguments - to get the input arguments from command line
     * configure_logging - to configure logging
-    * main - main function to checking if the rows could be piled up
+    * get_input_chunks - to read the input integers in chunks
+    * main - main function to find the distinct prime factors
 """
 
 # Built-In Imports
 import logging.config
 import json
 import argparse
+import os
 
 # User Imports
-from solutions.factorization.prime_factors import get_prime_factors_array
+from solutions.factorization.sieve import load_smallest_factor_table
+from solutions.factorization.batch_gcd import get_prime_factors_batch
+from solutions.factorization.parallel_factors import get_prime_factors_parallel
 __author__ = "praveen@gyandata.com"
 
 LOGGER = logging.getLogger(__name__)
 
 
+def get_positive_integer(value):
+    """
+    Function to read a command line argument which should be a positive integer
+    :param value: The argument
+    :type value: str
+    :return: number
+    :rtype: int
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("{} is not a positive integer".format(value))
+    return number
+
+
 def get_input_arguments():
     """
     Function to get the input arguments from command line
@@ -32,6 +52,11 @@ def get_input_arguments():
     my_parser = argparse.ArgumentParser(allow_abbrev=False)
     my_parser.add_argument('--logfile', action='store', type=str, required=True)
     my_parser.add_argument('--inputfile', action='store', type=str, required=True)
+    my_parser.add_argument('--sievefile', action='store', type=str, required=False)
+    my_parser.add_argument('--sievelimit', action='store', type=int, default=10 ** 7)
+    my_parser.add_argument('--batch', action='store_true')
+    my_parser.add_argument('--workers', action='store', type=int, default=os.cpu_count())
+    my_parser.add_argument('--chunksize', action='store', type=get_positive_integer, default=100000)
 
     args = my_parser.parse_args()
     return args
@@ -48,34 +73,64 @@ def configure_logging(filepath):
     LOGGER.info("Configured Logging")
 
 
-def get_input_data(filepath):
+def get_input_chunks(filepath, chunk_size):
     """
-    Function to load file having input data
+    Function to read the file having input data in chunks of integers
+    The file is read a block at a time, and a number split across two
+    blocks is joined back
     :param filepath: path of file consisting of input data
     :type filepath: str
-    :return: data
-    :rtype: list
+    :param chunk_size: The number of integers in a chunk
+    :type chunk_size: int
+    :return: A generator of the chunks of integers
+    :rtype: generator
     """
 
+    chunk = []
+    leftover = ""
     with open(filepath) as file:
-        data = file.read()
-
-    data = data.split()
-    data = list(map(lambda arg: int(arg.rstrip(",.")), data))
-    return data
+        while True:
+            data = file.read(1 << 20)
+            if not data:
+                break
+            data = leftover + data
+            words = data.split()
+            leftover = words.pop() if words and not data[-1].isspace() else ""
+            chunk.extend(map(lambda arg: int(arg.rstrip(",.")), words))
+
+            # The full chunks are sliced with a running start, and only the rest is kept
+            start = 0
+            while len(chunk) - start >= chunk_size:
+                yield chunk[start:start + chunk_size]
+                start += chunk_size
+            del chunk[:start]
+
+    if leftover:
+        chunk.append(int(leftover.rstrip(",.")))
+    if chunk:
+        yield chunk
 
 
 def main():
     """
-    Main function to check if the rows could be piled up
+    Main function to find the distinct prime factors of the product of the integers
     :return: Nothing
     :rtype: None
     """
     arguments = get_input_arguments()
     configure_logging(arguments.logfile)
 
-    elements = get_input_data(arguments.inputfile)
-    get_prime_factors_array(elements)
+    chunks = get_input_chunks(arguments.inputfile, arguments.chunksize)
+    if arguments.batch:
+        get_prime_factors_batch([element for chunk in chunks for element in chunk])
+        LOGGER.info("Done")
+        return
+
+    if arguments.sievefile:
+        # The saved smallest prime factor table is reused, and built when it
+        # Does not cover the limit, the workers load it memory mapped
+        load_smallest_factor_table(arguments.sievefile, arguments.sievelimit)
+    get_prime_factors_parallel(chunks, arguments.workers, arguments.sievefile)
     LOGGER.info("Done")
 
 
@@ -7,7 +7,8 @@ import json
 import argparse
 
 # User Imports
-from solutions.toeplitz.generate_matrix import generate_toeplitz_matrix
+from solutions.toeplitz.toeplitz_matrix import ToeplitzMatrix
+from solutions.toeplitz.matrix_writer import WRITERS, write_toeplitz_matrix
 
 __author__ = "praveen@gyandata.com"
 
@@ -24,6 +25,8 @@ def get_input_arguments():
     my_parser = argparse.ArgumentParser(allow_abbrev=False)
     my_parser.add_argument('--logfile', action='store', type=str, required=True)
     my_parser.add_argument('--inputfile', action='store', type=str, required=True)
+    my_parser.add_argument('--outputfile', action='store', type=str, required=False)
+    my_parser.add_argument('--format', action='store', type=str, choices=list(WRITERS), default='csv')
 
     args = my_parser.parse_args()
     return args
@@ -70,12 +73,15 @@ def main():
     configure_logging(arguments.logfile)
 
     elements = get_input_data(arguments.inputfile)
-    if len(elements) > 1:
-        matrix = generate_toeplitz_matrix(elements[0], elements[1])
-    else:
-        matrix = generate_toeplitz_matrix(elements[0])
+    columns = elements[1] if len(elements) > 1 else None
 
-    for row in matrix:
+    if arguments.outputfile:
+        # The rows are written a chunk at a time, without building the matrix
+        write_toeplitz_matrix(arguments.outputfile, elements[0], columns, arguments.format)
+        return
+
+    # The rows are made one by one as they are printed
+    for row in ToeplitzMatrix(elements[0], columns):
         print(row)
 
 
@@ -6,7 +6,9 @@ This script requires the following modules be installed in the python environmen
     * json - to load json files
 
 This script contains the following function
+    * get_positive_integer - to read a positive integer argument
     * configure_logging - to configure logging
+    * get_input_chunks - to read the input text in chunks
     * main - main function to count the words
 """
 
@@ -14,15 +16,34 @@ This script contains the following function
 import logging.config
 import json
 import argparse
+import os
 
 # User Imports
-from solutions.word_count.counter import count_words
+from solutions.word_count.counter import count_words_stream, iterate_text_chunks, \
+    ENCODING, ENCODING_ERRORS
+from solutions.word_count.parallel_counter import count_words_parallel
+from solutions.word_count.heavy_hitters import count_top_words_stream
+from solutions.word_count.checkpoint import count_words_incremental
 
 __author__ = "praveen@gyandata.com"
 
 LOGGER = logging.getLogger(__name__)
 
 
+def get_positive_integer(value):
+    """
+    Function to read a command line argument which should be a positive integer
+    :param value: The argument
+    :type value: str
+    :return: number
+    :rtype: int
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("{} is not a positive integer".format(value))
+    return number
+
+
 def get_input_arguments():
     """
     Function to get the input arguments from command line
@@ -33,6 +54,11 @@ def get_input_arguments():
     my_parser = argparse.ArgumentParser(allow_abbrev=False)
     my_parser.add_argument('--logfile', action='store', type=str, required=True)
     my_parser.add_argument('--inputfile', action='store', type=str, required=True)
+    my_parser.add_argument('--chunksize', action='store', type=get_positive_integer, default=1 << 20)
+    my_parser.add_argument('--workers', action='store', type=int, default=os.cpu_count())
+    my_parser.add_argument('--top', action='store', type=int, required=False)
+    my_parser.add_argument('--capacity', action='store', type=int, default=1 << 14)
+    my_parser.add_argument('--checkpointfile', action='store', type=str, required=False)
 
     args = my_parser.parse_args()
     return args
@@ -49,19 +75,21 @@ def configure_logging(filepath):
     LOGGER.info("Configured Logging")
 
 
-def get_input_data(filepath):
+def get_input_chunks(filepath, chunk_size):
     """
-    Function to load file having input data
+    Function to read the file having input data in chunks of text, so that
+    the whole file is never in memory
     :param filepath: path of file consisting of input data
     :type filepath: str
-    :return: data
-    :rtype: str
+    :param chunk_size: The number of characters read at a time
+    :type chunk_size: int
+    :return: A generator of the chunks of text
+    :rtype: generator
     """
 
-    with open(filepath) as file:
-        data = file.read()
-
-    return data
+    # The same encoding is used as by the parallel and the incremental counting
+    with open(filepath, encoding=ENCODING, errors=ENCODING_ERRORS) as file:
+        yield from iterate_text_chunks(file, chunk_size)
 
 
 def main():
@@ -73,8 +101,18 @@ def main():
     arguments = get_input_arguments()
     configure_logging(arguments.logfile)
 
-    sentence = get_input_data(arguments.inputfile)
-    count_words(sentence)
+    if arguments.checkpointfile:
+        # Only the bytes appended since the last run are read
+        count_words_incremental(arguments.inputfile, arguments.checkpointfile, arguments.chunksize)
+    elif arguments.top:
+        # Only the most frequent words are found, keeping the counts of a fixed number of words
+        count_top_words_stream(get_input_chunks(arguments.inputfile, arguments.chunksize),
+                               arguments.top, arguments.capacity)
+    elif arguments.workers > 1:
+        # The file is memory mapped and its ranges are counted in a process pool
+        count_words_parallel(arguments.inputfile, arguments.workers)
+    else:
+        count_words_stream(get_input_chunks(arguments.inputfile, arguments.chunksize))
     LOGGER.info("Done Counting")
 
 
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+""" Module for finding the distinct prime factors of the product of a huge array
+
+Only the distinct primes of the product are needed, so instead of factorizing
+every element, the elements are deduplicated, and the primes which are already
+found are divided out of all the remaining elements together, with a batch gcd
+over product and remainder trees. Only the parts left after that are
+factorized, so the factorizations done are close to the number of distinct
+primes rather than the number of elements.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * math - to find the gcd
+
+This script contains the following function
+    * build_product_tree - Builds the product tree of the given numbers
+    * get_remainders - Finds a number modulo every leaf of a product tree
+    * remove_primes - Divides the primes of a product out of all the numbers
+    * get_prime_factors_batch - Given a array of number, will return the
+                                prime factors of it's product
+"""
+
+import logging
+import math
+
+from solutions.factorization.pollard_rho import SMALL_PRIMES, get_prime_factors_large
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# The numbers are handled in groups of this size, so that the top of a
+# Product tree stays small enough for python's integer division
+GROUP_SIZE = 512
+
+
+def build_product_tree(numbers):
+    """
+    Function to build the product tree of the given numbers
+    The first level is the numbers, and every other level holds the products
+    of the pairs of the level below, till a single product remains
+    :param numbers: The numbers for the leaves of the tree
+    :type numbers: list
+    :return: tree - The levels of the tree, from the leaves to the root
+    :rtype: list
+    """
+
+    tree = [list(numbers)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)])
+    return tree
+
+
+def get_remainders(number, tree):
+    """
+    Function to find the number modulo every leaf of the product tree
+    The number is reduced modulo the root, and each remainder is then reduced
+    modulo the children of its node, so every division is by a small node
+    :param number: The number to be reduced
+    :type number: int
+    :param tree: The product tree from build_product_tree
+    :type tree: list
+    :return: remainders - number modulo each of the leaves
+    :rtype: list
+    """
+
+    remainders = [number % tree[-1][0]]
+    for level in reversed(tree[:-1]):
+        remainders = [remainders[i // 2] % node for i, node in enumerate(level)]
+    return remainders
+
+
+def remove_primes(numbers, product):
+    """
+    Function to divide all the powers of the primes of product out of the numbers
+    gcd(n, product mod n) holds exactly the primes of product dividing n
+    :param numbers: The numbers from which the primes are removed
+    :type numbers: list
+    :param product: The product of the primes to be removed
+    :type product: int
+    :return: cofactors, common - What is left of every number, and the
+             product of the primes of product which divided it
+    :rtype: tuple
+    """
+
+    cofactors = []
+    common = []
+    for start in range(0, len(numbers), GROUP_SIZE):
+        group = numbers[start:start + GROUP_SIZE]
+        remainders = get_remainders(product, build_product_tree(group))
+        for number, remainder in zip(group, remainders):
+            divisor = math.gcd(number, remainder)
+            common.append(divisor)
+
+            # Dividing till the number has no prime of the divisor left
+            factor = divisor
+            while factor > 1:
+                number //= factor
+                factor = math.gcd(number, factor)
+            cofactors.append(number)
+    return cofactors, common
+
+
+def get_prime_factors_batch(elements):
+    """
+    Function to find the prime_factors of the product of given elements
+    The elements are deduplicated and the primes below 1000 are removed in one
+    batch. Then the remaining parts are factorized in blocks of doubling size,
+    and after each block, the new primes are removed from all the parts not
+    factorized yet, so a part is only factorized when it has a prime not seen
+    :param elements: The array of elements, for which the prime_factors of
+                    it's product has to be found
+    :type elements: list
+    :return: results - The prime factors of the product
+    :rtype: set
+    """
+    try:
+        # Checking if the elements is a list
+        if not issubclass(type(elements), list):
+            raise ValueError("The elements should be a list")
+
+        # Checking if all the items of elements is int
+        check_type = map(lambda arg: issubclass(type(arg), int), elements)
+        if not all(check_type):
+            raise ValueError("The list items should be integer")
+
+        results = set()
+        parts = sorted(set(element for element in elements if element > 1))
+
+        parts, common = remove_primes(parts, math.prod(SMALL_PRIMES))
+        for divisor in set(common):
+            results.update(prime for prime in SMALL_PRIMES if divisor % prime == 0)
+
+        block_size = 1
+        factorized = 0
+        while parts:
+            block, parts = parts[:block_size], parts[block_size:]
+            new_primes = set()
+            for part in block:
+                if part > 1:
+                    new_primes.update(get_prime_factors_large(part))
+                    factorized += 1
+            results.update(new_primes)
+
+            if new_primes and parts:
+                parts, _ = remove_primes(parts, math.prod(new_primes))
+                parts = [part for part in parts if part > 1]
+            block_size *= 2
+
+        LOGGER.debug("Parts factorized: %s", factorized)
+        LOGGER.info("Prime Factors are: %s", results)
+        return results
+    except ValueError as err:
+        LOGGER.error(err)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+""" Module for finding the distinct prime factors of a stream of integers in parallel
+
+The integers arrive in chunks, every chunk is factorized in a process pool and
+the partial sets of primes are merged as the chunks finish. Only a few chunks
+per worker are in flight at any time, so the input never has to be in memory
+all at once. When a saved smallest prime factor table is given, every worker
+loads it memory mapped, so all of them share the same pages.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * concurrent - to factorize the chunks in parallel
+    * numpy - to load the smallest prime factor table
+
+This script contains the following function
+    * load_worker_table - Loads the smallest prime factor table in a worker
+    * factorize_chunk - Finds the prime factors of the product of a chunk
+    * get_prime_factors_parallel - Finds the prime factors of the product of
+                                   all the chunks in a process pool
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+from solutions.factorization.prime_factors import collect_prime_factors
+from solutions.factorization.sieve import get_table_path
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# The smallest prime factor table of the current process
+WORKER_TABLE = None
+
+
+def load_worker_table(sievefile):
+    """
+    Function run when a worker starts, to load the smallest prime factor table
+    :param sievefile: path of the .npy file having the table, .npy is added when missing, or None
+    :type sievefile: str
+    :return: Nothing
+    :rtype: None
+    """
+    global WORKER_TABLE
+    WORKER_TABLE = np.load(get_table_path(sievefile), mmap_mode='r') if sievefile else None
+
+
+def factorize_chunk(chunk):
+    """
+    Function to find the prime factors of the product of a chunk of integers
+    :param chunk: The integers
+    :type chunk: list
+    :return: The prime factors of the product
+    :rtype: set
+    """
+    return collect_prime_factors(chunk, WORKER_TABLE)
+
+
+def get_prime_factors_parallel(chunks, workers=1, sievefile=None):
+    """
+    Function to find the prime_factors of the product of all the given chunks
+    :param chunks: An iterable of the chunks of integers
+    :type chunks: iterable
+    :param workers: The number of processes factorizing the chunks,
+                    with one the chunks are factorized in this process
+    :type workers: int
+    :param sievefile: path of a saved smallest prime factor table
+    :type sievefile: str
+    :return: results - The prime factors of the product
+    :rtype: set
+    """
+
+    results = set()
+    if workers <= 1:
+        load_worker_table(sievefile)
+        for chunk in chunks:
+            results.update(factorize_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=load_worker_table,
+                                 initargs=(sievefile,)) as executor:
+            pending = set()
+            for chunk in chunks:
+                if len(pending) >= 2 * workers:
+                    # Waiting for a chunk to finish before reading more of the input
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results.update(future.result())
+                pending.add(executor.submit(factorize_chunk, chunk))
+            for future in wait(pending).done:
+                results.update(future.result())
+
+    LOGGER.info("Prime Factors are: %s", results)
+    return results
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+""" Module for finding the distinct prime factors of large integers
+
+Trial division needs sqrt(n) steps, which is too slow for 64 bit numbers
+having two large prime factors. Here the small primes are divided out first,
+the remaining part is tested with Miller - Rabin, and split with Brent's
+variant of Pollard's rho until all the parts are prime. Only integer
+arithmetic is used, so the numbers may be of any size.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * math - to find the gcd
+    * random - to pick the starting points of pollard's rho
+
+This script contains the following function
+    * is_prime - Checks if a number is prime with the Miller - Rabin test
+    * find_factor - Finds a non trivial factor of a composite number
+    * get_prime_factors_large - Given a number, it return the prime factors
+"""
+
+import logging
+import math
+import random
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# The primes below 1000 are removed by trial division
+SMALL_PRIMES = [prime for prime in range(2, 1000)
+                if all(prime % divisor for divisor in range(2, int(math.sqrt(prime)) + 1))]
+
+# Testing with these bases gives the correct answer for all n < 3.3 * 10^24,
+# Which covers every 64 bit number
+WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def is_prime(number):
+    """
+    Function to check if a number is prime with the Miller - Rabin test
+    The test is deterministic below 3.3 * 10^24, above that a composite is
+    reported as prime with a negligible probability
+    :param number: The number to be checked
+    :type number: int
+    :return: True if the number is prime
+    :rtype: bool
+    """
+
+    if number < 2:
+        return False
+    for prime in WITNESSES:
+        if number % prime == 0:
+            return number == prime
+
+    # Writing number - 1 as odd * 2^power
+    odd, power = number - 1, 0
+    while odd % 2 == 0:
+        odd //= 2
+        power += 1
+
+    for witness in WITNESSES:
+        value = pow(witness, odd, number)
+        if value in (1, number - 1):
+            continue
+        for _ in range(power - 1):
+            value = value * value % number
+            if value == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def find_factor(number):
+    """
+    Function to find a non trivial factor of a composite number
+    with Brent's variant of Pollard's rho. The products of the differences
+    are accumulated, so that a gcd is taken only once every few steps
+    :param number: The composite number, it should not be a prime power of 2
+    :type number: int
+    :return: factor - A factor between 1 and the number
+    :rtype: int
+    """
+
+    if number % 2 == 0:
+        return 2
+
+    while True:
+        value = random.randrange(2, number)
+        constant = random.randrange(1, number)
+        batch = 128
+        factor = cycle_length = product = 1
+        while factor == 1:
+            saved = value
+            for _ in range(cycle_length):
+                value = (value * value + constant) % number
+
+            steps = 0
+            while steps < cycle_length and factor == 1:
+                backtrack = value
+                for _ in range(min(batch, cycle_length - steps)):
+                    value = (value * value + constant) % number
+                    product = product * abs(saved - value) % number
+                factor = math.gcd(product, number)
+                steps += batch
+            cycle_length *= 2
+
+        if factor == number:
+            # The batch went past the factor, so the steps are redone one at a time
+            factor = 1
+            while factor == 1:
+                backtrack = (backtrack * backtrack + constant) % number
+                factor = math.gcd(abs(saved - backtrack), number)
+
+        if factor != number:
+            return factor
+        # The cycle closed without a factor, trying again with other constants
+
+
+def get_prime_factors_large(number):
+    """
+    Function which finds the distinct prime factors of given number
+    using trial division by the small primes, Miller - Rabin and Pollard's rho
+    :param number: The number for which the prime factors are to be found
+    :type number: int
+    :return: prime_factors
+    :rtype: set
+    """
+
+    prime_factors = set()
+    for prime in SMALL_PRIMES:
+        if number % prime == 0:
+            prime_factors.add(prime)
+            while number % prime == 0:
+                number //= prime
+    if number == 1:
+        return prime_factors
+
+    # The parts still to be split, every part has no factor below 1000
+    parts = [number]
+    while parts:
+        part = parts.pop()
+        if part == 1:
+            continue
+        if part < SMALL_PRIMES[-1] ** 2 or is_prime(part):
+            prime_factors.add(part)
+            continue
+        factor = find_factor(part)
+        parts.extend((factor, part // factor))
+    return prime_factors
@@ -11,6 +11,8 @@ This script requires the following modules be installed in the python environmen
 
 This script contains the following function
     * get_prime_factors - Given a number, it return the prime factors
+    * collect_prime_factors - Given a array of number, returns the prime factors
+                              of it's product, without checking or logging
     * get_prime_factors_array - Given a array of number, will return the
                                 prime factors of it's product
 """
@@ -18,17 +20,26 @@ This script contains the following function
 import logging
 import math
 
+from solutions.factorization.sieve import get_prime_factors_from_table
+from solutions.factorization.pollard_rho import get_prime_factors_large
 
 __author__ = "praveen@gyandata.com"
 
 LOGGER = logging.getLogger(__name__)
 
+# Numbers from this size are factorized with pollard's rho instead of
+# Trial division, which would need more than 2^16 divisions
+LARGE_NUMBER_LIMIT = 1 << 32
 
-def get_prime_factors(number):
+
+def get_prime_factors(number, table=None):
     """
     Function which finds the distinct prime factors of given number
     :param number: The number for which the prime factors are to be found
     :type number: int
+    :param table: The smallest prime factor table from the sieve module, used
+                  when the number is covered by it
+    :type table: numpy.ndarray
     :return: prime_factors
     :rtype: set
     """
@@ -36,6 +47,10 @@ def get_prime_factors(number):
     try:
         if not issubclass(type(number), int):
             raise ValueError("The Number should be a integer")
+
+        if table is not None and 0 < number < len(table):
+            return get_prime_factors_from_table(number, table)
+
         prime_factors = set()
 
         while number % 2 == 0:
@@ -45,7 +60,7 @@ def get_prime_factors(number):
             prime_factors.add(2)
 
             # And the number is divided by 2
-            number /= 2
+            number //= 2
 
         # Looping from 3 till square root of number
         # While skipping all even number, since it is taken
@@ -56,27 +71,50 @@ def get_prime_factors(number):
                 prime_factors.add(i)
 
                 # And the number is divided by it
-                number /= i
+                number //= i
 
         if number > 2:
             # If the remaining number is greater the 2,
             # Then it is the one prime_factor that is greater than
             # Square root of the given number
-            prime_factors.add(int(number))
+            prime_factors.add(number)
 
         return prime_factors
     except ValueError as err:
         LOGGER.error(err)
 
 
-def get_prime_factors_array(elements):
+def collect_prime_factors(elements, table=None):
+    """
+    Function to find the prime_factors of the product of given elements,
+    the large elements are sent to the pollard_rho module
+    :param elements: The array of integers
+    :type elements: list
+    :param table: The smallest prime factor table from the sieve module
+    :type table: numpy.ndarray
+    :return: results - The prime factors of the product
+    :rtype: set
+    """
+
+    results = set()
+    for element in elements:
+        if element >= LARGE_NUMBER_LIMIT and (table is None or element >= len(table)):
+            results.update(get_prime_factors_large(element))
+        else:
+            results.update(get_prime_factors(element, table))
+    return results
+
+
+def get_prime_factors_array(elements, table=None):
     """
     Function to find the prime_factors of the product of given elements
     :param elements: The array of elements, for which the prime_factors of
                     it's product has to be found
     :type elements: list
-    :return: Nothing
-    :rtype: None
+    :param table: The smallest prime factor table from the sieve module
+    :type table: numpy.ndarray
+    :return: results - The prime factors of the product
+    :rtype: set
     """
     try:
         # Checking if the elements is a list
@@ -87,9 +125,8 @@ def get_prime_factors_array(elements):
         check_type = map(lambda arg: issubclass(type(arg), int), elements)
         if not all(check_type):
             raise ValueError("The list items should be integer")
-        results = set()
-        for element in elements:
-            results.update(get_prime_factors(element))
+        results = collect_prime_factors(elements, table)
         LOGGER.info("Prime Factors are: %s", results)
+        return results
     except ValueError as err:
         LOGGER.error(err)
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+""" Module for factorizing every integer of a range with a segmented sieve
+
+The range [low, high) is split into segments, and in every segment each prime
+up to sqrt(high) is divided out of its multiples with array operations. What
+is left above one after that is itself a prime. The factorizations are given
+in compressed form: the factors of low + i are primes[offsets[i]:offsets[i + 1]]
+with the exponents at the same positions. The segments may be spread across
+a process pool, and only a few of them are in memory at any time.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * math - to find the square root of the range end
+    * collections - to keep the segments being worked on in order
+    * concurrent - to factorize the segments in parallel
+    * numpy - to store the segments
+
+This script contains the following function
+    * get_base_primes - Finds the primes up to a limit
+    * divide_out - Divides the primes out of the numbers, counting the exponents
+    * factorize_segment - Factorizes every integer of one segment
+    * iterate_range_factorizations - Factorizes a range segment by segment
+    * factorize_range - Factorizes every integer of a range
+"""
+
+import logging
+import math
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from solutions.factorization.sieve import build_smallest_factor_table
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_base_primes(limit):
+    """
+    Function to find the primes up to limit
+    :param limit: The largest number which is checked
+    :type limit: int
+    :return: primes
+    :rtype: numpy.ndarray
+    """
+
+    table = build_smallest_factor_table(limit + 1)
+    numbers = np.arange(len(table))
+    return numbers[2:][table[2:] == numbers[2:]]
+
+
+def divide_out(remaining, positions, primes):
+    """
+    Function to divide all the powers of the primes out of the numbers at the
+    positions, each prime must divide its number at least once
+    :param remaining: The numbers of the segment, they are divided in place
+    :type remaining: numpy.ndarray
+    :param positions: The positions of the numbers
+    :type positions: numpy.ndarray
+    :param primes: The prime dividing the number at each position
+    :type primes: numpy.ndarray
+    :return: exponents - The power of the prime in each number
+    :rtype: numpy.ndarray
+    """
+
+    values = remaining[positions]
+    exponents = np.zeros(len(positions), dtype=np.int64)
+    divisible = np.ones(len(positions), dtype=bool)
+    while divisible.any():
+        values[divisible] //= primes[divisible]
+        exponents[divisible] += 1
+        divisible = values % primes == 0
+    remaining[positions] = values
+    return exponents
+
+
+def factorize_segment(low, high, base_primes):
+    """
+    Function to factorize every integer of the segment [low, high)
+    :param low: The first number of the segment, at least 1
+    :type low: int
+    :param high: The number after the last number of the segment
+    :type high: int
+    :param base_primes: The primes up to sqrt(high - 1), in increasing order
+    :type base_primes: numpy.ndarray
+    :return: offsets, primes, exponents - The factorizations of the segment
+    :rtype: tuple
+    """
+
+    length = high - low
+    remaining = np.arange(low, high, dtype=np.int64)
+    positions, primes, exponents = [], [], []
+
+    # The primes shorter than the segment have many multiples in it,
+    # And are taken one at a time
+    small_primes = base_primes[base_primes < length]
+    for prime in small_primes.tolist():
+        start = -low % prime
+        prime_positions = np.arange(start, length, prime)
+        prime_array = np.full(len(prime_positions), prime, dtype=np.int64)
+        positions.append(prime_positions)
+        primes.append(prime_array)
+        exponents.append(divide_out(remaining, prime_positions, prime_array))
+
+    # The other primes have at most one multiple, so they are all taken at once.
+    # A number may have several of them, so each round takes only the smallest
+    # Of the primes still pending for every number
+    large_primes = base_primes[base_primes >= length].astype(np.int64)
+    starts = -low % large_primes
+    has_multiple = starts < length
+    large_positions = starts[has_multiple]
+    large_primes = large_primes[has_multiple]
+    while len(large_positions):
+        _, first = np.unique(large_positions, return_index=True)
+        positions.append(large_positions[first])
+        primes.append(large_primes[first])
+        exponents.append(divide_out(remaining, large_positions[first], large_primes[first]))
+
+        pending = np.ones(len(large_positions), dtype=bool)
+        pending[first] = False
+        large_positions, large_primes = large_positions[pending], large_primes[pending]
+
+    # Anything left above one is a prime larger than sqrt(high - 1)
+    left_positions = np.flatnonzero(remaining > 1)
+    positions.append(left_positions)
+    primes.append(remaining[left_positions])
+    exponents.append(np.ones(len(left_positions), dtype=np.int64))
+
+    # The factors were found in increasing order of the primes, the stable
+    # Sort by position keeps them in that order for every number
+    positions = np.concatenate(positions)
+    order = np.argsort(positions, kind="stable")
+    offsets = np.zeros(length + 1, dtype=np.int64)
+    np.cumsum(np.bincount(positions, minlength=length), out=offsets[1:])
+    return offsets, np.concatenate(primes)[order], np.concatenate(exponents)[order]
+
+
+def iterate_range_factorizations(low, high, segment_size=1 << 18, workers=1):
+    """
+    Function to factorize every integer of [low, high) segment by segment
+    With more than one worker, the segments are factorized in a process pool,
+    with at most two segments per worker waiting at any time
+    :param low: The first number of the range, at least 1
+    :type low: int
+    :param high: The number after the last number of the range
+    :type high: int
+    :param segment_size: The number of integers in a segment
+    :type segment_size: int
+    :param workers: The number of processes factorizing the segments
+    :type workers: int
+    :return: A generator of (segment_low, offsets, primes, exponents) in order
+    :rtype: generator
+    """
+
+    base_primes = get_base_primes(math.isqrt(max(high - 1, 1)))
+    segment_lows = range(low, high, segment_size)
+
+    if workers <= 1:
+        for segment_low in segment_lows:
+            yield (segment_low,) + factorize_segment(segment_low, min(segment_low + segment_size, high),
+                                                     base_primes)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for segment_low in segment_lows:
+            if len(pending) >= 2 * workers:
+                done_low, future = pending.popleft()
+                yield (done_low,) + future.result()
+            pending.append((segment_low, executor.submit(factorize_segment, segment_low,
+                                                         min(segment_low + segment_size, high),
+                                                         base_primes)))
+        while pending:
+            done_low, future = pending.popleft()
+            yield (done_low,) + future.result()
+
+
+def factorize_range(low, high, segment_size=1 << 18, workers=1):
+    """
+    Function to factorize every integer of the range [low, high)
+    For example, for low = 10, high = 13 the factorizations would be:
+            offsets = [0, 2, 3, 5]
+            primes = [2, 5, 11, 2, 3]
+            exponents = [1, 1, 1, 2, 1]
+    That is 10 = 2 * 5, 11 = 11 and 12 = 2^2 * 3
+    :param low: The first number of the range, at least 1
+    :type low: int
+    :param high: The number after the last number of the range
+    :type high: int
+    :param segment_size: The number of integers in a segment
+    :type segment_size: int
+    :param workers: The number of processes factorizing the segments
+    :type workers: int
+    :return: offsets, primes, exponents - The factorizations of the range
+    :rtype: tuple
+    """
+
+    try:
+        if low < 1 or high < low:
+            raise ValueError("The range should be of positive integers")
+
+        all_offsets, all_primes, all_exponents = [np.zeros(1, dtype=np.int64)], [], []
+        number_of_factors = 0
+        for _, offsets, primes, exponents in iterate_range_factorizations(low, high, segment_size, workers):
+            all_offsets.append(offsets[1:] + number_of_factors)
+            all_primes.append(primes)
+            all_exponents.append(exponents)
+            number_of_factors += len(primes)
+
+        empty = np.zeros(0, dtype=np.int64)
+        LOGGER.info("Factorized %s integers from %s", high - low, low)
+        return (np.concatenate(all_offsets), np.concatenate(all_primes or [empty]),
+                np.concatenate(all_exponents or [empty]))
+    except ValueError as err:
+        LOGGER.error(err)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+""" Module for the smallest prime factor table
+
+The smallest prime factor of every number below a limit is found once with a
+linear sieve, and saved as a .npy file. Later runs load the file memory mapped,
+so they start at once and the processes using it share the same pages.
+With the table, a number is factorized by repeatedly dividing it by its
+smallest prime factor, in O(log n) lookups.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * math - to find the square root of the limit
+    * os - to check for and replace the saved table
+    * numpy - to store the table
+
+This script contains the following function
+    * build_smallest_factor_table - Builds the table with a linear sieve
+    * get_table_path - Gives the path at which the table is saved
+    * load_smallest_factor_table - Loads the saved table, building it if needed
+    * get_prime_factors_from_table - Finds the distinct prime factors using the table
+"""
+
+import logging
+import math
+import os
+
+import numpy as np
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+
+def build_smallest_factor_table(limit):
+    """
+    Function to build the table of smallest prime factors of numbers below limit
+    In the linear sieve every composite number is written exactly once, by its
+    smallest prime p, as p * i where i has no prime factor smaller than p.
+    The primes are taken in increasing order, and for each of them all such i
+    are marked at once
+    :param limit: The numbers below limit are covered by the table
+    :type limit: int
+    :return: table - table[n] is the smallest prime factor of n, for n >= 2
+    :rtype: numpy.ndarray
+    """
+
+    table = np.zeros(max(limit, 2), dtype=np.uint32)
+    largest = len(table) - 1
+    for prime in range(2, int(math.sqrt(largest)) + 1):
+        if table[prime]:
+            # Composite numbers are not used for marking
+            continue
+
+        # When the prime is reached, the unmarked numbers from the prime onwards
+        # Are exactly the numbers without a smaller prime factor
+        cofactors = np.arange(prime, largest // prime + 1)
+        cofactors = cofactors[table[prime:largest // prime + 1] == 0]
+        table[cofactors * prime] = prime
+
+    # The numbers still not marked are the primes themselves
+    numbers = np.arange(len(table), dtype=np.uint32)
+    unmarked = table == 0
+    table[unmarked] = numbers[unmarked]
+    return table
+
+
+def get_table_path(filepath):
+    """
+    Function to get the path at which the table is saved, np.save adds the
+    .npy extension to a path which does not have it
+    :param filepath: path of the table
+    :type filepath: str
+    :return: filepath - the path ending with .npy
+    :rtype: str
+    """
+    return filepath if filepath.endswith(".npy") else filepath + ".npy"
+
+
+def load_smallest_factor_table(filepath, limit):
+    """
+    Function to load the smallest prime factor table saved at filepath
+    If the file does not exist or does not cover the limit, the table is built
+    and saved there first
+    :param filepath: path of the .npy file having the table, .npy is added when missing
+    :type filepath: str
+    :param limit: The numbers below limit must be covered by the table
+    :type limit: int
+    :return: table - The memory mapped table
+    :rtype: numpy.ndarray
+    """
+
+    filepath = get_table_path(filepath)
+    if os.path.exists(filepath):
+        try:
+            table = np.load(filepath, mmap_mode='r')
+            if len(table) >= limit:
+                return table
+            LOGGER.info("The table at %s only covers %s numbers", filepath, len(table))
+
+            # The old table is unmapped, so that the file can be replaced
+            del table
+        except ValueError as err:
+            # A table which is broken, or is being written by another process
+            LOGGER.info("The table at %s could not be loaded: %s", filepath, err)
+
+    LOGGER.info("Building the smallest prime factor table till %s", limit)
+
+    # The table is written to a file of this process and moved in place in one
+    # Step, so that the other processes never see a partly written table
+    temporary_path = "{}.{}.tmp".format(filepath, os.getpid())
+    with open(temporary_path, "wb") as file_object:
+        np.save(file_object, build_smallest_factor_table(limit))
+    os.replace(temporary_path, filepath)
+    return np.load(filepath, mmap_mode='r')
+
+
+def get_prime_factors_from_table(number, table):
+    """
+    Function which finds the distinct prime factors of given number
+    using the smallest prime factor table
+    :param number: The number for which the prime factors are to be found,
+                   it should be less than the length of the table
+    :type number: int
+    :param table: The smallest prime factor table
+    :type table: numpy.ndarray
+    :return: prime_factors
+    :rtype: set
+    """
+
+    prime_factors = set()
+    while number > 1:
+        prime = int(table[number])
+        prime_factors.add(prime)
+        while number % prime == 0:
+            number //= prime
+    return prime_factors
@@ -1,13 +1,22 @@
 # -*- coding: utf-8 -*-
 """ Module for implementing Gram_schmidt Orthogonalization
 
+The vectors may be dense lists, or sparse vectors given either as a dictionary
+of {index: value} for the non zero values, or as a CSR row (any object having
+indices and data, like a scipy.sparse.csr_matrix of one row). With sparse
+vectors the work depends only on the number of non zero values.
+
 This script requires the following modules be installed in the python environment
     * logging - to perform logging operations
 
 This script contains the following function
+    * is_sparse - Checks if a vector is a sparse vector
+    * to_sparse - Converts a vector to a dictionary of its non zero values
     * inner_product - finds the dot product of given two vectors
     * find_projection - Finds the vector project of v_vector on u_vector
     * orthogonalize_vectors - Given a set of vectors, it finds the orthogonalized vectors
+    * orthogonalize_sparse_vectors - Given a set of sparse vectors, it finds the
+                                     orthogonalized vectors
 """
 
 # Standard imports
@@ -17,18 +26,59 @@ __author__ = "praveen@gyandata.com"
 
 LOGGER = logging.getLogger(__name__)
 
+# A value of an orthogonalized sparse vector smaller than this fraction of the
+# Vector's length is dropped, and a vector whose orthogonal part is smaller than
+# This fraction of its length is taken to be dependent on the previous vectors
+DROP_TOLERANCE = 1e-12
+
+
+def is_sparse(vector):
+    """
+    Function to check if a vector is a sparse vector
+    :param vector: The vector
+    :type vector: list, dict
+    :return: True for a dictionary or a CSR row
+    :rtype: bool
+    """
+    return isinstance(vector, dict) or (hasattr(vector, "indices") and hasattr(vector, "data"))
+
+
+def to_sparse(vector):
+    """
+    Function to convert a vector to a dictionary of {index: value} of
+    its non zero values
+    :param vector: The vector
+    :type vector: list, dict
+    :return: sparse_vector
+    :rtype: dict
+    """
+    if isinstance(vector, dict):
+        return vector
+    if is_sparse(vector):
+        return {int(index): value for index, value in zip(vector.indices, vector.data) if value}
+    return {index: value for index, value in enumerate(vector) if value}
+
 
 def inner_product(vector1, vector2):
     """
     Function used to find the dot product of two given vectors
     :param vector1: The first vector
-    :type vector1: list
+    :type vector1: list, dict
     :param vector2: The second vector
-    :type vector2: list
+    :type vector2: list, dict
     :return: dot product of two vectors
     :rtype: int, float
     """
     try:
+        if is_sparse(vector1) or is_sparse(vector2):
+            # Only the indices which are non zero in the sparse vector are visited,
+            # And when both are sparse, the smaller one is looped over
+            if is_sparse(vector1) and is_sparse(vector2):
+                smaller, larger = sorted((to_sparse(vector1), to_sparse(vector2)), key=len)
+                return sum(value * larger.get(index, 0) for index, value in smaller.items())
+            sparse, dense = (vector1, vector2) if is_sparse(vector1) else (vector2, vector1)
+            return sum(value * dense[index] for index, value in to_sparse(sparse).items())
+
         # Checking if the cubes is a list
         if not issubclass(type(vector1), list) and issubclass(type(vector2), list):
             raise ValueError("The vectors should be a list")
@@ -43,22 +93,25 @@ def inner_product(vector1, vector2):
         LOGGER.error(err)
 
 
-def find_projection(v_vector, u_vector):
+def find_projection(v_vector, u_vector, squared_norm=None):
     """
     Function to find the vector project of v_vector on to u_vector
     The definition of projection of u_v on v_v is given by:
     Proj (v_v, u_u) = ((v_v inner_product u_v)/(u_v inner_product u_v))*u_u
 
     :param v_vector: The vector being projected
-    :type v_vector: list
+    :type v_vector: list, dict
     :param u_vector: The vector on which the other vector is being projected
-    :type u_vector: list
-    :return: projection
-    :rtype: list
+    :type u_vector: list, dict
+    :param squared_norm: (u_v inner_product u_v) if it is already known
+    :type squared_norm: int, float
+    :return: projection - sparse when the u_vector is sparse
+    :rtype: list, dict
     """
     try:
         # Checking if the cubes is a list
-        if not issubclass(type(v_vector), list) and issubclass(type(u_vector), list):
+        if not (is_sparse(v_vector) or is_sparse(u_vector)) and \
+                not issubclass(type(v_vector), list) and issubclass(type(u_vector), list):
             raise ValueError("The vectors should be a list")
 
         # The numerator of the multiplication factor for finding
@@ -67,26 +120,33 @@ def find_projection(v_vector, u_vector):
 
         # The denominator of the multiplication factor for finding
         # The projection is given by inner product of u_vector and u_vector
-        denominator = inner_product(u_vector, u_vector)
+        denominator = squared_norm if squared_norm is not None else inner_product(u_vector, u_vector)
         mul_factor = numerator / denominator
 
         # The projection vector is given by multiplying the multiplication
         # Factor (mul_factor) with each elements of the u_vector
+        if is_sparse(u_vector):
+            return {index: value * mul_factor for index, value in to_sparse(u_vector).items()}
         projection = list(map(lambda arg: arg * mul_factor, u_vector))
         return projection
     except ValueError as err:
         LOGGER.error(err)
 
 
-def orthogonalize_vectors(vectors):
+def orthogonalize_vectors(vectors, drop_tolerance=DROP_TOLERANCE):
     """
     Function to orthogonalize a set of vectors
     The orthogonalzied vector is found by the following formula:
 
             u(k) = v(k) - sum( projection(v(k), u(j) ) ......where j = 1, 2, ....k-1
 
+    If any of the vectors is sparse, all the orthogonalized vectors are given
+    as dictionaries, see orthogonalize_sparse_vectors
+
     :param vectors: The set of vectors for which orthogonal vectors need to be found
     :type vectors: list
+    :param drop_tolerance: The drop tolerance for sparse vectors, see orthogonalize_sparse_vectors
+    :type drop_tolerance: float
     :return: ortho_vectors - The orthogonalized vectors
     :rtype: list
     """
@@ -96,6 +156,9 @@ def orthogonalize_vectors(vectors):
         if not issubclass(type(vectors), list):
             raise ValueError("The vectors should be a list")
 
+        if any(map(is_sparse, vectors)):
+            return orthogonalize_sparse_vectors(vectors, drop_tolerance)
+
         if len(vectors) > len(vectors[0]):
             raise ValueError("The number of vectors cannot be greater than it's dimension")
 
@@ -131,3 +194,48 @@ def orthogonalize_vectors(vectors):
         return ortho_vectors
     except ValueError as err:
         LOGGER.exception(err)
+
+
+def orthogonalize_sparse_vectors(vectors, drop_tolerance=DROP_TOLERANCE):
+    """
+    Function to orthogonalize a set of sparse vectors
+    The values of an orthogonalized vector smaller than drop_tolerance times
+    its length are dropped, so that the fill in from the projections does not
+    make the orthogonalized vectors dense. A larger drop_tolerance keeps the
+    vectors sparser, at the cost of their orthogonality. A vector whose
+    orthogonal part is smaller than drop_tolerance times its own length is
+    dependent on the previous vectors, and gives an empty vector
+    :param vectors: The set of vectors, each a list, dictionary or CSR row
+    :type vectors: list
+    :param drop_tolerance: The drop tolerance relative to the length of a vector
+    :type drop_tolerance: float
+    :return: ortho_vectors - The orthogonalized vectors as dictionaries
+    :rtype: list
+    """
+
+    ortho_vectors = []
+    squared_norms = []
+    for vector in map(to_sparse, vectors):
+        new_ortho_vector = dict(vector)
+        for u_vector, squared_norm in zip(ortho_vectors, squared_norms):
+            if not squared_norm:
+                # Nothing was left of a dependent vector, so there is nothing to project on
+                continue
+            mul_factor = inner_product(vector, u_vector) / squared_norm
+            if not mul_factor:
+                # The vectors share no non zero index, so the projection is zero
+                continue
+            for index, value in u_vector.items():
+                new_ortho_vector[index] = new_ortho_vector.get(index, 0) - value * mul_factor
+
+        if ortho_vectors:
+            squared_norm = inner_product(new_ortho_vector, new_ortho_vector)
+            if squared_norm <= drop_tolerance ** 2 * inner_product(vector, vector):
+                new_ortho_vector = {}
+            else:
+                threshold = drop_tolerance * squared_norm ** 0.5
+                new_ortho_vector = {index: value for index, value in new_ortho_vector.items()
+                                    if abs(value) > threshold}
+        ortho_vectors.append(new_ortho_vector)
+        squared_norms.append(inner_product(new_ortho_vector, new_ortho_vector))
+    return ortho_vectors
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+""" Module for implementing Gram_schmidt Orthogonalization on numpy arrays
+
+The vectors are the rows of a 2-D array. Each vector is projected against all
+the previous orthonormal vectors at once, with matrix products, and the
+projection is done a second time to remove the rounding error left by the
+first one ("twice is enough"). This keeps the orthogonality as good as the
+modified Gram_schmidt, while the work is done by BLAS instead of python loops.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * numpy - to store the vectors
+
+This script contains the following function
+    * orthonormalize - Finds the orthonormal vectors and the projection coefficients
+    * orthogonalize_array - Given a set of vectors, it finds the orthogonalized vectors
+    * orthogonalize_batch - Given many sets of vectors, it finds the orthogonalized
+                            vectors of every set together
+    * qr - Finds the Q and R factors of a matrix from the same pass
+    * solve_least_squares - Solves a least squares problem with the Q and R factors
+"""
+
+# Standard imports
+import logging
+
+import numpy as np
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# A vector whose remaining part is smaller than this fraction of its length
+# Is taken to be dependent on the previous vectors
+TOLERANCE = 1e-12
+
+# The number of vectors projected together against the previous vectors
+BLOCK_SIZE = 64
+
+
+def orthonormalize(vectors):
+    """
+    Function to find the orthonormal vectors of the given vectors, along with
+    the coefficients such that vectors = coefficients @ basis
+    The vectors are taken in blocks, a block is first projected against all the
+    previous orthonormal vectors with matrix products, and the vectors inside
+    the block are then projected against each other.
+    A vector which depends on the previous vectors gets a zero row in the basis
+    :param vectors: The vectors as the rows of the array
+    :type vectors: numpy.ndarray
+    :return: basis, coefficients - The orthonormal vectors as rows, and the
+             lower triangular coefficients
+    :rtype: tuple
+    """
+
+    number_of_vectors = vectors.shape[0]
+    basis = np.zeros(vectors.shape, dtype=np.float64)
+    coefficients = np.zeros((number_of_vectors, number_of_vectors), dtype=np.float64)
+
+    for start in range(0, number_of_vectors, BLOCK_SIZE):
+        end = min(start + BLOCK_SIZE, number_of_vectors)
+        block = np.array(vectors[start:end], dtype=np.float64)
+        lengths = np.linalg.norm(block, axis=1)
+        for _ in range(2):
+            # Projections of the whole block on all the previous orthonormal vectors
+            projection = block @ basis[:start].T
+            block -= projection @ basis[:start]
+            coefficients[start:end, :start] += projection
+
+        for i in range(start, end):
+            vector = block[i - start]
+            for _ in range(2):
+                projection = basis[start:i] @ vector
+                vector -= projection @ basis[start:i]
+                coefficients[i, start:i] += projection
+
+            norm = np.linalg.norm(vector)
+            if norm > TOLERANCE * lengths[i - start]:
+                coefficients[i, i] = norm
+                basis[i] = vector / norm
+    return basis, coefficients
+
+
+def orthogonalize_array(vectors):
+    """
+    Function to orthogonalize a set of vectors given as the rows of an array
+    It gives the same vectors as orthogonalize_vectors, without the rounding:
+
+            u(k) = v(k) - sum( projection(v(k), u(j) ) ......where j = 1, 2, ....k-1
+
+    :param vectors: The set of vectors for which orthogonal vectors need to be found
+    :type vectors: numpy.ndarray
+    :return: ortho_vectors - The orthogonalized vectors
+    :rtype: numpy.ndarray
+    """
+
+    try:
+        vectors = np.asarray(vectors)
+        if vectors.ndim != 2:
+            raise ValueError("The vectors should be a 2-D array")
+
+        if vectors.shape[0] > vectors.shape[1]:
+            raise ValueError("The number of vectors cannot be greater than it's dimension")
+
+        basis, coefficients = orthonormalize(vectors)
+
+        # The orthogonal vectors keep the length of the part that is left
+        return basis * np.diag(coefficients)[:, np.newaxis]
+    except ValueError as err:
+        LOGGER.exception(err)
+
+
+def orthogonalize_batch(vectors):
+    """
+    Function to orthogonalize many independent sets of vectors in one pass,
+    like the frames of the elements of a mesh. The loop is only over the
+    vectors of a set, each step handles that vector of every set together
+    :param vectors: The sets of vectors, of shape (batch, k, n), where
+                    vectors[b] holds the k vectors of the set b as rows
+    :type vectors: numpy.ndarray
+    :return: ortho_vectors - The orthogonalized vectors of every set
+    :rtype: numpy.ndarray
+    """
+
+    try:
+        vectors = np.asarray(vectors)
+        if vectors.ndim != 3:
+            raise ValueError("The vectors should be a 3-D array")
+
+        if vectors.shape[1] > vectors.shape[2]:
+            raise ValueError("The number of vectors cannot be greater than it's dimension")
+
+        ortho_vectors = np.zeros(vectors.shape, dtype=np.float64)
+        basis = np.zeros(vectors.shape, dtype=np.float64)
+        for i in range(vectors.shape[1]):
+            vector = np.array(vectors[:, i], dtype=np.float64)
+            lengths = np.linalg.norm(vector, axis=1)
+            for _ in range(2):
+                # Projections of the vector of every set on the previous orthonormal vectors of the set
+                projection = np.einsum("bjn,bn->bj", basis[:, :i], vector)
+                vector -= np.einsum("bj,bjn->bn", projection, basis[:, :i])
+
+            norms = np.linalg.norm(vector, axis=1)
+            independent = norms > TOLERANCE * lengths
+            ortho_vectors[independent, i] = vector[independent]
+            basis[independent, i] = vector[independent] / norms[independent, np.newaxis]
+        return ortho_vectors
+    except ValueError as err:
+        LOGGER.exception(err)
+
+
+def qr(matrix):
+    """
+    Function to find the reduced QR factorization of a matrix, matrix = Q @ R,
+    where the columns of Q are the orthonormal Gram_schmidt vectors of the
+    columns of the matrix, and R holds the projection coefficients.
+    Both come from the same pass, in full float64 precision
+    :param matrix: The matrix of shape (n, k), whose columns are the vectors
+    :type matrix: numpy.ndarray
+    :return: q_matrix, r_matrix - Q of shape (n, k) and the upper triangular R of shape (k, k)
+    :rtype: tuple
+    """
+
+    try:
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2:
+            raise ValueError("The matrix should be a 2-D array")
+
+        if matrix.shape[1] > matrix.shape[0]:
+            raise ValueError("The number of vectors cannot be greater than it's dimension")
+
+        # The vectors are the rows for orthonormalize, so the factors come out transposed
+        basis, coefficients = orthonormalize(matrix.T)
+        return basis.T, coefficients.T
+    except ValueError as err:
+        LOGGER.exception(err)
+
+
+def solve_least_squares(q_matrix, r_matrix, values):
+    """
+    Function to find x minimising |matrix @ x - values|, from the factors
+    given by qr. Since Q has orthonormal columns, x is the solution of the
+    triangular system R @ x = Q.T @ values, found by back substitution.
+    The columns of the matrix should be independent
+    :param q_matrix: The Q factor from qr
+    :type q_matrix: numpy.ndarray
+    :param r_matrix: The R factor from qr
+    :type r_matrix: numpy.ndarray
+    :param values: The right hand side, of shape (n,) or (n, m)
+    :type values: numpy.ndarray
+    :return: solution - x, of shape (k,) or (k, m)
+    :rtype: numpy.ndarray
+    """
+
+    solution = q_matrix.T @ np.asarray(values, dtype=np.float64)
+    for i in range(r_matrix.shape[0] - 1, -1, -1):
+        solution[i] -= r_matrix[i, i + 1:] @ solution[i + 1:]
+        solution[i] /= r_matrix[i, i]
+    return solution
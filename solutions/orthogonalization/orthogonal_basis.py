@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+""" Module for building an orthogonal basis one vector at a time
+
+The vectors may arrive one by one, like feature vectors computed online. Each
+new vector is projected on the orthogonal vectors found so far, and only the
+part which is left is added to the basis. The squared norm of every basis
+vector is kept, so it is not found again for every new vector.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+
+This script contains the following class
+    * OrthogonalBasis - An orthogonal basis which grows as vectors are appended
+"""
+
+# Standard imports
+import logging
+
+# User Imports
+from solutions.orthogonalization.gram_schmidt import inner_product, find_projection
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# A vector whose orthogonal part is smaller than this fraction of its length
+# Is taken to be a combination of the basis
+TOLERANCE = 1e-12
+
+
+class OrthogonalBasis:
+    """
+    Class to keep the orthogonal vectors of the vectors appended so far
+    For the vectors appended in order, the orthogonal vectors are the same as
+    from orthogonalize_vectors, except they are not rounded
+    """
+
+    def __init__(self, vectors=None):
+        """
+        :param vectors: The vectors to start the basis with
+        :type vectors: list
+        """
+        self.vectors = []
+        self.squared_norms = []
+        for vector in vectors or []:
+            self.append(vector)
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def __iter__(self):
+        return iter(self.vectors)
+
+    def append(self, vector):
+        """
+        Function to add a vector to the basis
+        The orthogonal vector is given by:
+
+                u(k) = v(k) - sum( projection(v(k), u(j) ) ......where j = 1, 2, ....k-1
+
+        A vector which is a combination of the basis leaves (almost) nothing,
+        and is not added
+        :param vector: The new vector
+        :type vector: list
+        :return: new_ortho_vector - The orthogonal part of the vector
+        :rtype: list
+        """
+        try:
+            if not issubclass(type(vector), list):
+                raise ValueError("The vector should be a list")
+
+            if self.vectors and len(vector) != len(self.vectors[0]):
+                raise ValueError("The vector should have the same dimension as the basis")
+
+            new_ortho_vector = list(vector)
+            for u_vector, squared_norm in zip(self.vectors, self.squared_norms):
+                # The cached squared norm saves an inner product for every basis vector
+                projection = find_projection(vector, u_vector, squared_norm)
+                new_ortho_vector = [value - projected for value, projected in zip(new_ortho_vector, projection)]
+
+            squared_norm = inner_product(new_ortho_vector, new_ortho_vector)
+            if squared_norm > TOLERANCE ** 2 * inner_product(vector, vector):
+                self.vectors.append(new_ortho_vector)
+                self.squared_norms.append(squared_norm)
+            return new_ortho_vector
+        except ValueError as err:
+            LOGGER.exception(err)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+""" Module for orthogonalizing tall matrices which do not fit in memory
+
+The vectors are the columns of a tall matrix (for example 10^6 dimensions by a
+few hundred vectors) saved as a .npy file, which is read memory mapped. The
+matrix is split into blocks of rows, and orthogonalized with the tall skinny QR
+(TSQR): every block is factorized by householder QR on its own, the small R
+factors of the blocks are stacked and factorized once more, and the Q of each
+block is then corrected by its part of that second Q. Only one block of rows is
+in memory at a time, besides the stacked R factors of k x k each.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * numpy - to read and write the memory mapped matrices
+
+This script contains the following function
+    * get_row_blocks - Splits the rows into blocks having at least k rows
+    * orthogonalize_memmap - Orthogonalizes the columns of a .npy matrix into another .npy file
+"""
+
+# Standard imports
+import logging
+
+import numpy as np
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_row_blocks(number_of_rows, number_of_columns, block_rows):
+    """
+    Function to split the rows into blocks of block_rows rows, the last block
+    is joined to the one before it when it has fewer rows than columns, so that
+    every block has a square R factor
+    :param number_of_rows: The number of rows of the matrix
+    :type number_of_rows: int
+    :param number_of_columns: The number of columns of the matrix
+    :type number_of_columns: int
+    :param block_rows: The number of rows in a block
+    :type block_rows: int
+    :return: blocks - The (start, end) rows of each block
+    :rtype: list
+    """
+
+    block_rows = max(block_rows, number_of_columns)
+    starts = list(range(0, number_of_rows, block_rows))
+    if len(starts) > 1 and number_of_rows - starts[-1] < number_of_columns:
+        starts.pop()
+    return list(zip(starts, starts[1:] + [number_of_rows]))
+
+
+def orthogonalize_memmap(input_path, output_path, block_rows=1 << 16):
+    """
+    Function to orthogonalize the columns of the matrix saved at input_path
+    The orthonormal columns (Q) are written to output_path as a .npy file, and
+    the upper triangular R, with input = Q @ R, is returned. The signs are
+    chosen so that R has a non negative diagonal, which makes the columns of Q
+    the normalized Gram_schmidt vectors of the columns of the input
+    :param input_path: path of the .npy file having the matrix, of shape (n, k) with n >= k
+    :type input_path: str
+    :param output_path: path of the .npy file to which Q is written
+    :type output_path: str
+    :param block_rows: The number of rows read at a time
+    :type block_rows: int
+    :return: r_matrix
+    :rtype: numpy.ndarray
+    """
+
+    try:
+        matrix = np.load(input_path, mmap_mode='r')
+        if matrix.ndim != 2:
+            raise ValueError("The matrix should be a 2-D array")
+
+        number_of_rows, number_of_columns = matrix.shape
+        if number_of_columns > number_of_rows:
+            raise ValueError("The number of vectors cannot be greater than it's dimension")
+
+        q_matrix = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float64,
+                                             shape=matrix.shape)
+        blocks = get_row_blocks(number_of_rows, number_of_columns, block_rows)
+
+        # The Q of every block is written to the output, and its R is kept
+        r_factors = []
+        for start, end in blocks:
+            block_q, block_r = np.linalg.qr(np.asarray(matrix[start:end], dtype=np.float64))
+            q_matrix[start:end] = block_q
+            r_factors.append(block_r)
+
+        stacked_q, r_matrix = np.linalg.qr(np.concatenate(r_factors))
+        signs = np.where(np.diag(r_matrix) < 0, -1.0, 1.0)
+        stacked_q *= signs
+        r_matrix *= signs[:, np.newaxis]
+
+        # Correcting the Q of every block with its rows of the second Q
+        for index, (start, end) in enumerate(blocks):
+            rows = stacked_q[index * number_of_columns:(index + 1) * number_of_columns]
+            q_matrix[start:end] = q_matrix[start:end] @ rows
+        q_matrix.flush()
+
+        LOGGER.info("Orthogonalized %s vectors of dimension %s in %s blocks",
+                    number_of_columns, number_of_rows, len(blocks))
+        return r_matrix
+    except ValueError as err:
+        LOGGER.exception(err)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+""" Module for multiplying a toeplitz matrix with vectors using the FFT
+
+The element (i, j) of a toeplitz matrix depends only on (i - j), so the product
+with a vector x is a convolution:
+
+        y(i) = sum( a(i - j + m - 1) * x(j) ) ......where j = 0, 1, ....m-1
+
+where a is the first row reversed followed by the rest of the first column, of
+length (n + m - 1). The convolution is found by embedding it in a circulant of
+FFT length at least (n + m - 1), which takes O((n + m) log(n + m)) instead of
+O(n m). Small matrices are multiplied directly, where the FFT costs more than
+it saves.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * numpy - to find the FFT
+
+This script contains the following function
+    * get_diagonals - Gives the values on the diagonals of the matrix in order
+    * matvec - Multiplies a toeplitz matrix with a vector
+    * matmat - Multiplies a toeplitz matrix with many vectors at once
+"""
+
+# Standard imports
+import logging
+
+import numpy as np
+
+# User Imports
+from solutions.toeplitz.generate_matrix import generate_toeplitz_view
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# Matrices with at most these many elements are multiplied directly
+DIRECT_PRODUCT_SIZE = 1 << 14
+
+
+def get_diagonals(rows, columns=None):
+    """
+    Function to get the values on the diagonals of the toeplitz matrix, from
+    the top right corner to the bottom left one, which is the first row
+    reversed followed by the first column without its first element
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column
+    :type columns: list, numpy.ndarray
+    :return: diagonals
+    :rtype: numpy.ndarray
+    """
+    first_column = rows if columns is None or not len(columns) else columns
+    return np.concatenate((np.asarray(rows)[::-1], np.asarray(first_column)[1:]))
+
+
+def matmat(rows, columns, matrix):
+    """
+    Function to multiply the toeplitz matrix with the columns of a matrix
+    The FFT of the diagonals is found once and used for all the columns
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column, or None to use the first row
+    :type columns: list, numpy.ndarray
+    :param matrix: The vectors as columns, of shape (len(rows), k)
+    :type matrix: numpy.ndarray
+    :return: product - of shape (number of rows, k), float64 or complex128
+    :rtype: numpy.ndarray
+    """
+
+    try:
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2:
+            raise ValueError("The matrix should be a 2-D array")
+
+        number_of_columns = len(rows)
+        number_of_rows = len(rows if columns is None or not len(columns) else columns)
+        if matrix.shape[0] != number_of_columns:
+            raise ValueError("The matrix should have {} rows".format(number_of_columns))
+
+        if number_of_rows * number_of_columns <= DIRECT_PRODUCT_SIZE:
+            # The product is given in the same dtype as from the FFT, whatever the size
+            view = generate_toeplitz_view(rows, columns)
+            dtype = np.result_type(view, matrix, np.float64)
+            return view.astype(dtype) @ matrix.astype(dtype)
+
+        diagonals = get_diagonals(rows, columns)
+        length = 1 << (number_of_rows + number_of_columns - 2).bit_length()
+        if np.iscomplexobj(diagonals) or np.iscomplexobj(matrix):
+            product = np.fft.ifft(np.fft.fft(diagonals, length)[:, np.newaxis] *
+                                  np.fft.fft(matrix, length, axis=0), axis=0)
+        else:
+            product = np.fft.irfft(np.fft.rfft(diagonals, length)[:, np.newaxis] *
+                                   np.fft.rfft(matrix, length, axis=0), length, axis=0)
+
+        # The first (m - 1) values of the convolution are only partial overlaps
+        return product[number_of_columns - 1:number_of_columns - 1 + number_of_rows]
+    except ValueError as err:
+        LOGGER.exception(err)
+
+
+def matvec(rows, columns, vector):
+    """
+    Function to multiply the toeplitz matrix with a vector
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column, or None to use the first row
+    :type columns: list, numpy.ndarray
+    :param vector: The vector, of length len(rows)
+    :type vector: list, numpy.ndarray
+    :return: product - of length number of rows
+    :rtype: numpy.ndarray
+    """
+
+    product = matmat(rows, columns, np.asarray(vector)[:, np.newaxis])
+    return None if product is None else product[:, 0]
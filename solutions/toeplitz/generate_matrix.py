@@ -1,13 +1,27 @@
 # -*- coding: utf-8 -*-
 """ Module for generating the toeplitz matrix
+The matrix can be given as a list of rows, or as a numpy array. Every row of a
+toeplitz matrix is a window of the same length over the reversed first column
+followed by the first row, so the array is a read only strided view over that
+one buffer of (n + m - 1) elements, and no n x m copy is made.
+
+This script requires the following modules be installed in the python environment
+    * numpy - to build the strided view
+
 This script contains the following function
     * generate_toeplitz_matrix: It is used to generate a toeplitz matrix of given dimension
+    * generate_toeplitz_view: It gives the toeplitz matrix as a strided view over its diagonals
 """
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 __author__ = "praveen@gyandata.com"
 
+OUTPUT_MODES = ("list", "view", "array")
+
 
-def generate_toeplitz_matrix(rows, columns=None):
+def generate_toeplitz_matrix(rows, columns=None, output="list"):
     """
     Function to generate a toeplitz matrix
     The generated matrix will have the first row and column equal to
@@ -22,10 +36,21 @@ def generate_toeplitz_matrix(rows, columns=None):
     :type rows: list
     :param columns: first column
     :type columns: list
+    :param output: "list" for a list of rows, "view" for a read only strided
+                   view (see generate_toeplitz_view), and "array" for the view
+                   copied to a contiguous array
+    :type output: str
     :return: matrix: The generated toeplitz matrix
-    :rtype: list
+    :rtype: list, numpy.ndarray
     """
 
+    if output not in OUTPUT_MODES:
+        raise ValueError("The output should be one of {}".format(", ".join(OUTPUT_MODES)))
+
+    if output != "list":
+        view = generate_toeplitz_view(rows, columns)
+        return np.ascontiguousarray(view) if output == "array" else view
+
     # Setting the matrix variable to be an empty list
     matrix = []
     number_of_rows = len(columns) if columns else len(rows)
@@ -57,3 +82,27 @@ def generate_toeplitz_matrix(rows, columns=None):
         matrix.append(_row)
 
     return matrix
+
+
+def generate_toeplitz_view(rows, columns=None):
+    """
+    Function to give the toeplitz matrix as a read only view over one buffer
+    The buffer holds the first column reversed, without its first element,
+    followed by the first row. For row = [1, 2, 3], column = [1, 2, 3, 4]:
+            buffer = [4, 3, 2, 1, 2, 3]
+    Row r of the matrix is the window of len(rows) elements starting at
+    (number of rows - 1 - r), so the windows are taken in the reverse order.
+    Writing to the view is not allowed, as all the elements on a diagonal
+    share the same memory
+
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column
+    :type columns: list, numpy.ndarray
+    :return: matrix: The generated toeplitz matrix, of shape (number of rows, len(rows))
+    :rtype: numpy.ndarray
+    """
+
+    first_column = rows if columns is None or not len(columns) else columns
+    buffer = np.concatenate((np.asarray(first_column)[:0:-1], np.asarray(rows)))
+    return sliding_window_view(buffer, len(rows))[::-1]
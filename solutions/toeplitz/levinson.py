@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+""" Module for solving toeplitz systems with the Levinson recursion
+
+A square toeplitz system T x = y is solved in O(n^2) time and O(n) memory,
+without building T. The recursion grows the solution of the top left k x k
+block to the (k + 1) x (k + 1) block, with the help of the forward and the
+backward vectors f and b, which solve the block for the first and the last
+unit vectors. The matrix need not be symmetric.
+
+The recursion breaks down when a top left block is singular, even if the whole
+matrix is not, and loses accuracy when a block is nearly singular. In both
+cases the system is solved once more by a general solver on the dense matrix.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * numpy - to store the vectors
+
+This script contains the following function
+    * levinson_recursion - Solves the system with the recursion alone
+    * solve - Solves the system, falling back to a general solver when needed
+"""
+
+# Standard imports
+import logging
+
+import numpy as np
+
+# User Imports
+from solutions.toeplitz.fast_product import matmat
+from solutions.toeplitz.generate_matrix import generate_toeplitz_matrix
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# A top left block whose recursion denominator is smaller than this is taken
+# To be singular, and a solution with a larger relative residual is rejected
+TOLERANCE = 1e-10
+
+
+def levinson_recursion(rows, columns, values):
+    """
+    Function to solve the toeplitz system with the Levinson recursion
+    With e(f), e(b) and e(x) the errors of the padded vectors in the new row
+    or column of the (k + 1) x (k + 1) block:
+
+            f = ([f, 0] - e(f) [0, b]) / (1 - e(f) e(b))
+            b = ([0, b] - e(b) [f, 0]) / (1 - e(f) e(b))
+            x = [x, 0] + (y(k) - e(x)) b
+
+    :param rows: first row
+    :type rows: numpy.ndarray
+    :param columns: first column, of the same length
+    :type columns: numpy.ndarray
+    :param values: The right hand sides as columns, of shape (n, k)
+    :type values: numpy.ndarray
+    :return: solution - of shape (n, k), or None when the recursion breaks down
+    :rtype: numpy.ndarray
+    """
+
+    size = len(rows)
+    dtype = np.result_type(rows, columns, values, np.float64)
+    forward = np.zeros(size, dtype=dtype)
+    backward = np.zeros(size, dtype=dtype)
+    solution = np.zeros(values.shape, dtype=dtype)
+
+    if abs(rows[0]) <= TOLERANCE * np.abs(np.concatenate((rows, columns))).max():
+        return None
+    forward[0] = backward[0] = 1 / rows[0]
+    solution[0] = values[0] / rows[0]
+
+    for k in range(1, size):
+        # The new row of the block, read backwards, is columns[k], ...., columns[1]
+        new_row = columns[k:0:-1]
+        forward_error = new_row @ forward[:k]
+        backward_error = rows[1:k + 1] @ backward[:k]
+        denominator = 1 - forward_error * backward_error
+        if abs(denominator) <= TOLERANCE:
+            return None
+
+        previous_forward = forward[:k].copy()
+        forward[1:k + 1] -= forward_error * backward[:k]
+        forward[:k + 1] /= denominator
+        backward[1:k + 1] = backward[:k]
+        backward[0] = 0
+        backward[:k] -= backward_error * previous_forward
+        backward[:k + 1] /= denominator
+
+        solution_error = new_row @ solution[:k]
+        solution[:k + 1] += np.multiply.outer(backward[:k + 1], values[k] - solution_error)
+    return solution
+
+
+def solve(rows, columns, values):
+    """
+    Function to solve the square toeplitz system T x = values, where T is the
+    matrix given by generate_toeplitz_matrix(rows, columns)
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column, of the same length, or None for a symmetric matrix
+    :type columns: list, numpy.ndarray
+    :param values: The right hand side, of shape (n,), or (n, k) for k of them
+    :type values: list, numpy.ndarray
+    :return: solution - x, of the same shape as values
+    :rtype: numpy.ndarray
+    """
+
+    try:
+        rows = np.asarray(rows)
+        columns = rows if columns is None or not len(columns) else np.asarray(columns)
+        values = np.asarray(values)
+        if len(columns) != len(rows):
+            raise ValueError("The matrix should be square")
+
+        if values.ndim not in (1, 2) or values.shape[0] != len(rows):
+            raise ValueError("The values should have {} rows".format(len(rows)))
+
+        # The first element of the first column is the one from the first row
+        columns = np.concatenate((rows[:1], columns[1:]))
+        right_hand_sides = values.reshape(len(rows), -1)
+
+        solution = levinson_recursion(rows, columns, right_hand_sides)
+        if solution is not None:
+            residual = matmat(rows, columns, solution) - right_hand_sides
+            if np.linalg.norm(residual) > TOLERANCE * max(np.linalg.norm(right_hand_sides), 1):
+                solution = None
+
+        if solution is None:
+            LOGGER.info("The Levinson recursion broke down, solving the dense system")
+            matrix = generate_toeplitz_matrix(rows, columns, output="view")
+            solution = np.linalg.solve(matrix, right_hand_sides)
+        return solution.reshape(values.shape)
+    except ValueError as err:
+        LOGGER.exception(err)
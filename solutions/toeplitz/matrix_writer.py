@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+""" Module for writing a toeplitz matrix to a file without materializing it
+
+The rows are taken from the strided view over the first row and column (see
+generate_toeplitz_view), a chunk of rows at a time, and every chunk is written
+with one call. Only one chunk is in memory at a time, whatever the size of the
+matrix. The matrix can be written as CSV text, as raw binary values in row
+major order, or as a .npy file which numpy.load (or np.load with mmap_mode)
+can read back.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * numpy - to write the chunks
+
+This script contains the following function
+    * iterate_row_chunks - Gives the rows of the matrix, a chunk at a time
+    * write_csv - Writes the matrix as CSV text
+    * write_binary - Writes the matrix as raw binary values
+    * write_npy - Writes the matrix as a .npy file
+    * write_toeplitz_matrix - Writes the matrix to a file in the given format
+"""
+
+# Standard imports
+import logging
+
+import numpy as np
+
+# User Imports
+from solutions.toeplitz.generate_matrix import generate_toeplitz_view
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# The size of the chunk of rows which is written at a time
+CHUNK_BYTES = 1 << 24
+
+
+def iterate_row_chunks(rows, columns=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Function to give the rows of the toeplitz matrix as contiguous arrays of
+    about chunk_bytes each, at least one row is given at a time
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column
+    :type columns: list, numpy.ndarray
+    :param chunk_bytes: The size of a chunk in bytes
+    :type chunk_bytes: int
+    :return: The chunks of rows
+    :rtype: generator
+    """
+
+    view = generate_toeplitz_view(rows, columns)
+    chunk_rows = max(1, chunk_bytes // max(1, view.shape[1] * view.itemsize))
+    for start in range(0, view.shape[0], chunk_rows):
+        yield np.ascontiguousarray(view[start:start + chunk_rows])
+
+
+def write_csv(file_object, rows, columns=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Function to write the matrix as CSV text, one row per line
+    :param file_object: The file opened for writing text
+    :type file_object: file
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column
+    :type columns: list, numpy.ndarray
+    :param chunk_bytes: The size of a chunk in bytes
+    :type chunk_bytes: int
+    :return: Nothing
+    :rtype: None
+    """
+
+    for chunk in iterate_row_chunks(rows, columns, chunk_bytes):
+        # Integers are written as they are, and floats with enough digits to read them back
+        number_format = "%d" if np.issubdtype(chunk.dtype, np.integer) else "%.17g"
+        np.savetxt(file_object, chunk, fmt=number_format, delimiter=",")
+
+
+def write_binary(file_object, rows, columns=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Function to write the matrix as raw binary values in row major order,
+    with the native byte order of the dtype of the first row and column
+    :param file_object: The file opened for writing bytes
+    :type file_object: file
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column
+    :type columns: list, numpy.ndarray
+    :param chunk_bytes: The size of a chunk in bytes
+    :type chunk_bytes: int
+    :return: Nothing
+    :rtype: None
+    """
+
+    for chunk in iterate_row_chunks(rows, columns, chunk_bytes):
+        file_object.write(chunk.tobytes())
+
+
+def write_npy(file_object, rows, columns=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Function to write the matrix as a .npy file, the header holding the shape
+    and the dtype is written first, followed by the raw binary values
+    :param file_object: The file opened for writing bytes
+    :type file_object: file
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column
+    :type columns: list, numpy.ndarray
+    :param chunk_bytes: The size of a chunk in bytes
+    :type chunk_bytes: int
+    :return: Nothing
+    :rtype: None
+    """
+
+    view = generate_toeplitz_view(rows, columns)
+    header = {"descr": np.lib.format.dtype_to_descr(view.dtype), "fortran_order": False,
+              "shape": view.shape}
+    np.lib.format.write_array_header_1_0(file_object, header)
+    write_binary(file_object, rows, columns, chunk_bytes)
+
+
+WRITERS = {"csv": (write_csv, "w"), "binary": (write_binary, "wb"), "npy": (write_npy, "wb")}
+
+
+def write_toeplitz_matrix(filepath, rows, columns=None, output_format="csv",
+                          chunk_bytes=CHUNK_BYTES):
+    """
+    Function to write the toeplitz matrix to a file
+    :param filepath: The path of the output file
+    :type filepath: str
+    :param rows: first row
+    :type rows: list, numpy.ndarray
+    :param columns: first column
+    :type columns: list, numpy.ndarray
+    :param output_format: csv, binary or npy
+    :type output_format: str
+    :param chunk_bytes: The size of a chunk in bytes
+    :type chunk_bytes: int
+    :return: Nothing
+    :rtype: None
+    """
+
+    try:
+        if output_format not in WRITERS:
+            raise ValueError("The format should be one of {}".format(", ".join(WRITERS)))
+
+        writer, mode = WRITERS[output_format]
+        with open(filepath, mode) as file_object:
+            writer(file_object, rows, columns, chunk_bytes)
+        LOGGER.info("Written the toeplitz matrix to %s as %s", filepath, output_format)
+    except ValueError as err:
+        LOGGER.exception(err)
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+""" Module for a toeplitz matrix which is never materialized
+Every diagonal of a toeplitz matrix holds a single value, so the whole matrix
+is given by its first row and first column. Only these two are stored, and the
+elements, rows, columns and blocks are computed when they are asked for.
+The products with vectors are found with the FFT, see fast_product, and the
+square systems are solved with the Levinson recursion, see levinson.
+
+This script requires the following modules be installed in the python environment
+    * numpy - to multiply with vectors and solve systems
+
+This script contains the following class and function
+    * ToeplitzMatrix: A toeplitz matrix stored as its first row and column
+    * normalize_index: Turns a negative index into the positive one
+"""
+
+# User Imports
+from solutions.toeplitz.fast_product import matvec, matmat
+from solutions.toeplitz.levinson import solve
+
+__author__ = "praveen@gyandata.com"
+
+
+class ToeplitzMatrix:
+    """
+    Class for a toeplitz matrix stored in O(n + m) memory
+    It is the same matrix as generate_toeplitz_matrix(rows, columns). For example,
+    for row = [1, 2, 3], column = [1, 2, 3, 4]:
+            [1, 2, 3]
+            [2, 1, 2]
+            [3, 2, 1]
+            [4, 3, 2]
+
+    matrix[i, j] - the element
+    matrix[i] or matrix[i, :] - a row, as a list
+    matrix[:, j] - a column, as a list
+    matrix[a:b, c:d] - a block, which is again a ToeplitzMatrix (a list of rows
+                       when a step other than one is used)
+    """
+
+    def __init__(self, rows, columns=None):
+        """
+        :param rows: first row
+        :type rows: list, numpy.ndarray
+        :param columns: first column, its first element is taken from the first row
+        :type columns: list, numpy.ndarray
+        """
+        self.first_row = list(rows)
+        self.first_column = list(columns) if columns is not None and len(columns) else list(rows)
+        if self.first_row:
+            self.first_column[:1] = self.first_row[:1]
+
+    @property
+    def shape(self):
+        """
+        The number of rows and columns of the matrix
+        :return: shape
+        :rtype: tuple
+        """
+        return len(self.first_column), len(self.first_row)
+
+    def __len__(self):
+        return len(self.first_column)
+
+    def __iter__(self):
+        for row in range(len(self.first_column)):
+            yield self.get_row(row)
+
+    def __repr__(self):
+        return "ToeplitzMatrix(rows={}, columns={})".format(self.first_row, self.first_column)
+
+    def get_element(self, row, column):
+        """
+        Function to get the element at the given row and column, the element
+        is on the diagonal (column - row), which starts in the first row for
+        the upper diagonals and in the first column for the lower ones
+        :param row: row index
+        :type row: int
+        :param column: column index
+        :type column: int
+        :return: element
+        :rtype: int, float
+        """
+        if column >= row:
+            return self.first_row[column - row]
+        return self.first_column[row - column]
+
+    def get_row(self, row):
+        """
+        Function to get a row of the matrix, it is the first column read upwards
+        from the row, followed by the start of the first row
+        :param row: row index
+        :type row: int
+        :return: The row
+        :rtype: list
+        """
+        number_of_columns = len(self.first_row)
+        return (self.first_column[row:0:-1][:number_of_columns] +
+                self.first_row[:max(0, number_of_columns - row)])
+
+    def get_column(self, column):
+        """
+        Function to get a column of the matrix, it is the first row read
+        backwards from the column, followed by the start of the first column
+        :param column: column index
+        :type column: int
+        :return: The column
+        :rtype: list
+        """
+        number_of_rows = len(self.first_column)
+        return (self.first_row[column:0:-1][:number_of_rows] +
+                self.first_column[:max(0, number_of_rows - column)])
+
+    def to_list(self):
+        """
+        Function to materialize the matrix as a list of rows
+        :return: matrix
+        :rtype: list
+        """
+        return list(self)
+
+    def matvec(self, vector):
+        """
+        Function to multiply the matrix with a vector
+        :param vector: The vector, of length number of columns
+        :type vector: list, numpy.ndarray
+        :return: product
+        :rtype: numpy.ndarray
+        """
+        return matvec(self.first_row, self.first_column, vector)
+
+    def matmat(self, matrix):
+        """
+        Function to multiply the matrix with the columns of a matrix
+        :param matrix: The vectors as columns, of shape (number of columns, k)
+        :type matrix: numpy.ndarray
+        :return: product
+        :rtype: numpy.ndarray
+        """
+        return matmat(self.first_row, self.first_column, matrix)
+
+    def solve(self, values):
+        """
+        Function to solve the system matrix @ x = values, for a square matrix
+        :param values: The right hand side, of shape (n,), or (n, k) for k of them
+        :type values: list, numpy.ndarray
+        :return: solution
+        :rtype: numpy.ndarray
+        """
+        return solve(self.first_row, self.first_column, values)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        row_key, column_key = key
+        number_of_rows, number_of_columns = self.shape
+
+        if isinstance(row_key, slice) and isinstance(column_key, slice):
+            row_indices = range(*row_key.indices(number_of_rows))
+            column_indices = range(*column_key.indices(number_of_columns))
+            if row_indices.step == 1 and column_indices.step == 1 and row_indices and column_indices:
+                # A block of a toeplitz matrix is again toeplitz
+                return ToeplitzMatrix(self[row_indices.start, column_key], self[row_key, column_indices.start])
+            return [[self.get_element(row, column) for column in column_indices] for row in row_indices]
+
+        if isinstance(row_key, slice):
+            column = normalize_index(column_key, number_of_columns)
+            if row_key == slice(None):
+                return self.get_column(column)
+            return [self.get_element(row, column) for row in range(*row_key.indices(number_of_rows))]
+
+        row = normalize_index(row_key, number_of_rows)
+        if isinstance(column_key, slice):
+            if column_key == slice(None):
+                return self.get_row(row)
+            return [self.get_element(row, column) for column in range(*column_key.indices(number_of_columns))]
+        return self.get_element(row, normalize_index(column_key, number_of_columns))
+
+
+def normalize_index(index, length):
+    """
+    Function to turn a negative index into the positive one, like for lists
+    :param index: The index
+    :type index: int
+    :param length: The length of the dimension
+    :type length: int
+    :return: index
+    :rtype: int
+    """
+    if not -length <= index < length:
+        raise IndexError("The index {} is out of range".format(index))
+    return index % length
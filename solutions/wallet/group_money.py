@@ -11,9 +11,19 @@ together. The notes need not necessarily be in sorted order.
 
 This script requires the following modules be installed in the python environment
     * logging - to perform logging operations
+    * numpy - to store the dynamic programming layers
 
 This script contains the following function
+    * convert_notes - Converts the notes to their bit position in the mask
+    * compress_runs - Collapses the runs of equal notes into (note, count) pairs
+    * advance_layer_loop - Moves the dynamic programming layer past one note,
+                           one state at a time
+    * advance_layer - Moves the dynamic programming layer past one note,
+                      updating all the states with array operations
+    * advance_layer_with_choices - Moves the dynamic programming layer past a
+                                   run of notes, noting how each state was reached
     * find_number_of_transition - function to find the number of transition
+    * find_arrangement - Finds the notes to be moved and the order of the groups
 """
 
 # Standard imports
@@ -24,54 +34,251 @@ __author__ = "praveen@gyandata.com"
 
 LOGGER = logging.getLogger(__name__)
 
+# The note denominations, the index of a denomination is
+# The bit used to represent it in the mask
+DENOMINATIONS = (10, 20, 50, 100, 200, 500, 2000)
 
-def find_number_of_transition(notes):
+
+def convert_notes(notes):
     """
-    Function to find the number of transition required to group the wallet
+    Function to convert the notes to the bit position of their denomination
     :param notes: An array denoting the money in wallet
     :type notes: list
+    :return: notes_array - The bit position of each note
+    :rtype: numpy.ndarray
+    """
+
+    # Bit value representation of the note denominations
+    # Used for bit mapping
+    conversions = {denomination: bit for bit, denomination in enumerate(DENOMINATIONS)}
+
+    notes_array = np.zeros(len(notes), dtype=np.int64)
+    for i, note in enumerate(notes):
+        # Converting the original array to new one
+        # Based on the integers defined previously
+        notes_array[i] = conversions[int(note)]
+    return notes_array
+
+
+def compress_runs(notes_array):
+    """
+    Function to collapse the runs of equal notes, since a run is either kept
+    in place as a whole or not at all, each run needs only one step
+    :param notes_array: The bit position of each note
+    :type notes_array: numpy.ndarray
+    :return: run_notes, run_counts - The note and the length of each run
+    :rtype: tuple
+    """
+
+    if len(notes_array) == 0:
+        return notes_array[:0], notes_array[:0]
+
+    # A run starts at the first note and wherever the note changes
+    run_starts = np.flatnonzero(np.concatenate(([True], notes_array[1:] != notes_array[:-1])))
+    run_counts = np.diff(np.append(run_starts, len(notes_array)))
+    return notes_array[run_starts], run_counts
+
+
+def advance_layer_loop(current_layer, next_layer, note):
+    """
+    Function to fill the next layer of the dynamic programming table
+    from the current layer, after considering one more note.
+    The states are visited one at a time, it is kept as the reference
+    for advance_layer.
+    Each layer is indexed by [mask][last denomination] and holds the most
+    notes that can be kept in place for that state
+    :param current_layer: The layer before considering the note
+    :type current_layer: numpy.ndarray
+    :param next_layer: The layer to be filled, it is overwritten
+    :type next_layer: numpy.ndarray
+    :param note: The bit position of the note being considered
+    :type note: int
     :return: Nothing
     :rtype: None
     """
 
-    # Max Value of N - number of notes in the wallet
-    max_n = int(1e5 + 9)
+    # Skipping the note leaves every state as it is
+    next_layer[:] = current_layer
+    number_of_masks, number_of_denominations = current_layer.shape
+    for mask in range(0, number_of_masks):
+        for j in range(0, number_of_denominations):
+            if ((mask >> note) & 1) == False or (note == j):
+                next_layer[mask | (1 << note)][note] = max(next_layer[mask | (1 << note)][note],
+                                                           current_layer[mask][j] + 1)
 
-    # Table to store intermediate value in dynamic programming
-    dp_table = np.zeros((max_n, 1 << 7, 7), dtype=np.int64)
 
-    # Array denoting the notes in wallet
-    notes_array = np.zeros(max_n, dtype=np.int64)
+def advance_layer(current_layer, next_layer, note, count=1):
+    """
+    Function to fill the next layer of the dynamic programming table
+    from the current layer, after considering a run of count equal notes.
+    For a single note it gives the same layer as advance_layer_loop, but all
+    the states are updated with a few array operations.
 
-    # Bit value representation of the note denominations
-    # Used for bit mapping
-    converions = np.zeros(2001, dtype=np.int64)
-    converions[10] = 0
-    converions[20] = 1
-    converions[50] = 2
-    converions[100] = 3
-    converions[200] = 4
-    converions[500] = 5
-    converions[2000] = 6
-
-    for i in range(0, len(notes)):
-        # Converting the original array to new one
-        # Based on the integers defined previously
-        notes_array[i] = converions[int(notes[i])]
-
-    for i in range(0, len(notes)):
-        for mask in range(0, 1 << 7):
-            for j in range(0, 7):
-                dp_table[i + 1][mask][j] = max(dp_table[i + 1][mask][j], dp_table[i][mask][j])
-                if ((mask >> notes_array[i]) & 1) == False or (notes_array[i] == j):
-                    dp_table[i + 1][mask | (1 << notes_array[i])][notes_array[i]] = max(dp_table[i + 1]
-                                                                                        [mask | (1 << notes_array[i])]
-                                                                                        [notes_array[i]],
-                                                                                        dp_table[i][mask][j] + 1)
-    ans = 0
-    for mask in range(0, 1 << 7):
-        for j in range(0, 7):
-            ans = max(ans, dp_table[len(notes)][mask][j])
+    Taking the note only changes the states whose last denomination is the
+    note, and whose mask has the bit of the note set. Such a state is reached
+    either from itself (extending the current group) or from the mask without
+    the bit, whatever its last denomination was (starting a new group)
+    :param current_layer: The layer before considering the note
+    :type current_layer: numpy.ndarray
+    :param next_layer: The layer to be filled, it is overwritten
+    :type next_layer: numpy.ndarray
+    :param note: The bit position of the note being considered
+    :type note: int
+    :param count: The number of times the note is repeated
+    :type count: int
+    :return: Nothing
+    :rtype: None
+    """
+
+    # Skipping the note leaves every state as it is
+    next_layer[:] = current_layer
+
+    # Splitting the masks on the bit of the note, so that [:, 1] are the masks
+    # Having the bit and [:, 0] are the same masks without it
+    shape = (-1, 2, 1 << int(note), current_layer.shape[1])
+    current_view = current_layer.reshape(shape)
+    next_view = next_layer.reshape(shape)
+
+    next_view[:, 1, :, note] = np.maximum(current_view[:, 1, :, note],
+                                          current_view[:, 0].max(axis=-1)) + count
+
+
+def find_number_of_transition(notes):
+    """
+    Function to find the number of transition required to group the wallet
+    Only the current and the next layer of the dynamic programming table
+    are kept, so the memory used does not depend on the number of notes,
+    and a run of equal notes is taken in a single step
+    :param notes: An array denoting the money in wallet
+    :type notes: list
+    :return: number_of_transition
+    :rtype: int
+    """
+
+    notes_array = convert_notes(notes)
+
+    # The two layers of the dynamic programming table, they are
+    # Swapped after every note instead of keeping the whole table
+    shape = (1 << len(DENOMINATIONS), len(DENOMINATIONS))
+    current_layer = np.zeros(shape, dtype=np.int64)
+    next_layer = np.zeros(shape, dtype=np.int64)
+
+    for note, count in zip(*compress_runs(notes_array)):
+        advance_layer(current_layer, next_layer, note, count)
+        current_layer, next_layer = next_layer, current_layer
+
+    ans = int(current_layer.max())
 
     number_of_transition = len(notes) - ans
     LOGGER.info("The number of transitions are: %s", number_of_transition)
+    return number_of_transition
+
+
+def advance_layer_with_choices(current_layer, next_layer, note, count=1):
+    """
+    Function to fill the next layer like advance_layer, while also returning
+    how each of the updated states was reached, bit packed.
+    The updated states are the ones whose mask has the bit of the note and
+    whose last denomination is the note, in the order of the masks. The choice
+    for each of them is 0 when the run extended its own group and j + 1 when
+    the run started a new group after a state whose last denomination was j
+    :param current_layer: The layer before considering the note
+    :type current_layer: numpy.ndarray
+    :param next_layer: The layer to be filled, it is overwritten
+    :type next_layer: numpy.ndarray
+    :param note: The bit position of the note being considered
+    :type note: int
+    :param count: The number of times the note is repeated
+    :type count: int
+    :return: choices - The choices packed into bytes, each taking
+             number_of_denominations.bit_length() bits
+    :rtype: bytes
+    """
+
+    next_layer[:] = current_layer
+
+    shape = (-1, 2, 1 << int(note), current_layer.shape[1])
+    current_view = current_layer.reshape(shape)
+    next_view = next_layer.reshape(shape)
+
+    extend = current_view[:, 1, :, note]
+    start = current_view[:, 0]
+    best_start = start.max(axis=-1)
+    next_view[:, 1, :, note] = np.maximum(extend, best_start) + count
+
+    choices = np.where(extend >= best_start, 0, start.argmax(axis=-1) + 1).astype(np.uint8)
+
+    # Keeping only the low bits of every choice before packing them
+    width = current_layer.shape[1].bit_length()
+    choice_bits = np.unpackbits(choices.reshape(-1, 1), axis=1)[:, 8 - width:]
+    return np.packbits(choice_bits).tobytes()
+
+
+def find_arrangement(notes):
+    """
+    Function to find how the wallet has to be grouped with the least transitions
+    The choices of every step are kept bit packed, which takes
+    2^6 x 3 bits = 24 bytes per run of notes, and are followed back from the
+    best final state to find the notes which are kept in place
+    :param notes: An array denoting the money in wallet
+    :type notes: list
+    :return: moved_notes, grouping_order - The positions of the notes to be moved,
+             and the order of the denominations in the grouped wallet
+    :rtype: tuple
+    """
+
+    run_notes, run_counts = compress_runs(convert_notes(notes))
+    run_starts = np.cumsum(run_counts) - run_counts
+
+    number_of_denominations = len(DENOMINATIONS)
+    shape = (1 << number_of_denominations, number_of_denominations)
+    current_layer = np.zeros(shape, dtype=np.int64)
+    next_layer = np.zeros(shape, dtype=np.int64)
+
+    # Every run adds the same number of bytes, so the choices of a run
+    # Can be found from its index
+    width = number_of_denominations.bit_length()
+    step_size = ((1 << (number_of_denominations - 1)) * width + 7) // 8
+    choices = bytearray()
+    for note, count in zip(run_notes, run_counts):
+        choices += advance_layer_with_choices(current_layer, next_layer, note, count)
+        current_layer, next_layer = next_layer, current_layer
+
+    mask, last = np.unravel_index(int(current_layer.argmax()), shape)
+    mask, last = int(mask), int(last)
+
+    kept_runs = []
+    for step in range(len(run_notes) - 1, -1, -1):
+        note = int(run_notes[step])
+        if note != last or not (mask >> note) & 1:
+            # The state was not changed by this run
+            continue
+        kept_runs.append(step)
+
+        # Position of the state among the masks having the bit of the note
+        index = (mask >> (note + 1) << note) | (mask & ((1 << note) - 1))
+        step_bits = np.unpackbits(np.frombuffer(choices, dtype=np.uint8,
+                                                count=step_size, offset=step * step_size))
+        choice = int(step_bits[index * width:(index + 1) * width] @ (1 << np.arange(width - 1, -1, -1)))
+        if choice:
+            mask, last = mask ^ (1 << note), choice - 1
+
+    kept_runs.reverse()
+    kept = np.zeros(len(notes), dtype=bool)
+    grouping_order = []
+    for step in kept_runs:
+        kept[run_starts[step]:run_starts[step] + run_counts[step]] = True
+        denomination = DENOMINATIONS[run_notes[step]]
+        if denomination not in grouping_order:
+            grouping_order.append(denomination)
+
+    moved_notes = np.flatnonzero(~kept).tolist()
+    for position in moved_notes:
+        # The denominations which are moved entirely form groups at the end
+        denomination = int(notes[position])
+        if denomination not in grouping_order:
+            grouping_order.append(denomination)
+
+    LOGGER.info("The notes to be moved are at: %s", moved_notes)
+    LOGGER.info("The grouping order is: %s", grouping_order)
+    return moved_notes, grouping_order
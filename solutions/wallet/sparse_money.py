@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+""" Module for finding the minimum number of transition to organize a wallet
+having any set of denominations
+
+group_money keeps a dense layer of 2^k x k states for the 7 rupee notes, which
+is not possible for 15 - 20 denominations. Here only the (mask, last) states
+that are actually reachable are stored in a dictionary, and the states which
+can never do better than another state may optionally be pruned.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * itertools - to group the runs of equal notes
+
+This script contains the following function
+    * advance_states - Moves the reachable states past a run of equal notes
+    * prune_dominated_states - Removes the states dominated by other states
+    * find_number_of_transition_sparse - Finds the number of transition for
+                                         notes of any denominations
+"""
+
+# Standard imports
+import logging
+from itertools import groupby
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+
+def advance_states(states, note, count):
+    """
+    Function to update the reachable states after a run of equal notes
+    The states are stored as {(mask, last): notes kept in place}, and are
+    updated in place. Skipping the run leaves every state as it is, taking it
+    either extends the group of the last denomination or starts a new group
+    :param states: The reachable states
+    :type states: dict
+    :param note: The bit position of the note
+    :type note: int
+    :param count: The length of the run
+    :type count: int
+    :return: Nothing
+    :rtype: None
+    """
+
+    bit = 1 << note
+
+    # Starting the first group of the wallet with the run
+    updates = {(bit, note): count}
+    for (mask, last), kept in states.items():
+        if not mask & bit:
+            key = (mask | bit, note)
+        elif last == note:
+            key = (mask, note)
+        else:
+            # The denomination was already grouped before some other one
+            continue
+        if kept + count > updates.get(key, 0):
+            updates[key] = kept + count
+
+    for key, kept in updates.items():
+        if kept > states.get(key, 0):
+            states[key] = kept
+
+
+def prune_dominated_states(states):
+    """
+    Function to remove the states which can never do better than another state
+    A state (mask, last) is dominated by (other_mask, other_last), when the
+    other state has kept at least as many notes, its mask is a subset of the
+    mask, and it may still take the last denomination (that is, either it is
+    its own last denomination or it is not in the other mask).
+
+    To keep the pruning linear in the number of states, the subsets are only
+    followed through the masks which are themselves reachable, going from the
+    smaller masks to the bigger ones, so a few dominated states may remain
+    :param states: The reachable states
+    :type states: dict
+    :return: The states which are not dominated
+    :rtype: dict
+    """
+
+    # best_same - The most notes kept by a state having the same last
+    #             denomination and a subset of the mask
+    # best_any - The most notes kept by any state having a subset of the mask
+    best_same = {}
+    best_any = {}
+    kept_states = {}
+    for (mask, last), kept in sorted(states.items(), key=lambda arg: bin(arg[0][0]).count("1")):
+        inherited_same = 0
+        inherited_any = 0
+        remaining = mask
+        while remaining:
+            # Going over the masks having one bit less than the mask
+            lowest_bit = remaining & -remaining
+            remaining ^= lowest_bit
+            inherited_any = max(inherited_any, best_any.get(mask ^ lowest_bit, 0))
+            if lowest_bit != 1 << last:
+                inherited_same = max(inherited_same, best_same.get((mask ^ lowest_bit, last), 0))
+
+        # Any state on a subset of the mask without the last denomination may still take it
+        if kept > inherited_same and kept > best_any.get(mask ^ (1 << last), 0):
+            kept_states[(mask, last)] = kept
+
+        best_same[(mask, last)] = max(kept, inherited_same)
+        best_any[mask] = max(kept, inherited_any, best_any.get(mask, 0))
+    return kept_states
+
+
+def find_number_of_transition_sparse(notes, prune=False):
+    """
+    Function to find the number of transition required to group the wallet
+    The notes may be of any denominations, each new denomination gets the
+    next free bit of the mask as it first appears
+    :param notes: An array denoting the money in wallet
+    :type notes: list
+    :param prune: Whether to remove the dominated states, this is done
+                  whenever the number of states has doubled since the last pruning.
+                  It keeps fewer states in memory at the cost of the pruning time
+    :type prune: bool
+    :return: number_of_transition
+    :rtype: int
+    """
+
+    conversions = {}
+    states = {}
+    number_of_notes = 0
+    pruned_size = 1
+    for denomination, run in groupby(notes):
+        count = sum(1 for _ in run)
+        number_of_notes += count
+        note = conversions.setdefault(denomination, len(conversions))
+        advance_states(states, note, count)
+
+        if prune and len(states) >= 2 * pruned_size:
+            states = prune_dominated_states(states)
+            pruned_size = len(states)
+
+    LOGGER.debug("Reachable states at the end: %s", len(states))
+    number_of_transition = number_of_notes - max(states.values(), default=0)
+    LOGGER.info("The number of transitions are: %s", number_of_transition)
+    return number_of_transition
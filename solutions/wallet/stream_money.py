@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+""" Module for finding the minimum number of transition to organize a wallet
+whose notes arrive in chunks
+
+The dynamic programming layer of group_money is kept between the chunks, and
+the runs of equal notes are taken in a single step, even when a run is split
+across two chunks. The number of transitions for the notes seen so far can be
+read at any point.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * numpy - to store the dynamic programming layers
+
+This script contains the following class and functions
+    * WalletStream - Keeps the state of the wallet grouping between chunks
+    * iterate_note_chunks - Reads the notes of a file in chunks
+    * find_number_of_transition_stream - Finds the number of transition for
+                                         notes arriving in chunks
+"""
+
+# Standard imports
+import logging
+import numpy as np
+
+# User Imports
+from solutions.wallet.group_money import DENOMINATIONS, convert_notes, compress_runs, advance_layer
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+
+class WalletStream:
+    """
+    Class to find the number of transition of a wallet chunk by chunk
+    The last run of notes is held back until a different note arrives,
+    so that it is taken in one step however the chunks split it
+    """
+
+    def __init__(self):
+        shape = (1 << len(DENOMINATIONS), len(DENOMINATIONS))
+        self.current_layer = np.zeros(shape, dtype=np.int64)
+        self.next_layer = np.zeros(shape, dtype=np.int64)
+        self.number_of_notes = 0
+
+        # The run at the end of the notes seen so far
+        self.pending_note = None
+        self.pending_count = 0
+
+    def _advance(self, note, count):
+        """
+        Function to move the layer past a run of equal notes
+        :param note: The bit position of the note
+        :type note: int
+        :param count: The length of the run
+        :type count: int
+        :return: Nothing
+        :rtype: None
+        """
+        advance_layer(self.current_layer, self.next_layer, note, count)
+        self.current_layer, self.next_layer = self.next_layer, self.current_layer
+
+    def update(self, notes):
+        """
+        Function to add a chunk of notes to the wallet
+        :param notes: The next notes of the wallet
+        :type notes: list
+        :return: Nothing
+        :rtype: None
+        """
+        run_notes, run_counts = compress_runs(convert_notes(notes))
+        if len(run_notes) == 0:
+            return
+        self.number_of_notes += int(run_counts.sum())
+
+        for note, count in zip(run_notes.tolist(), run_counts.tolist()):
+            if note == self.pending_note:
+                # The run continues the one left from the previous chunk
+                self.pending_count += count
+                continue
+            if self.pending_note is not None:
+                self._advance(self.pending_note, self.pending_count)
+            self.pending_note, self.pending_count = note, count
+
+    @property
+    def number_of_transition(self):
+        """
+        The number of transition for the notes seen so far
+        :return: number_of_transition
+        :rtype: int
+        """
+        layer = self.current_layer
+        if self.pending_note is not None:
+            # The pending run is taken on a copy, since more of it may still come
+            layer = np.empty_like(self.current_layer)
+            advance_layer(self.current_layer, layer, self.pending_note, self.pending_count)
+        return self.number_of_notes - int(layer.max())
+
+
+def iterate_note_chunks(file_object, chunk_size=1 << 20):
+    """
+    Function to read the notes of a file in chunks, the notes are separated
+    by commas or white spaces. A note split across two reads is joined back
+    :param file_object: The opened file having the notes
+    :type file_object: io.TextIOBase
+    :param chunk_size: The number of characters read at a time
+    :type chunk_size: int
+    :return: A generator of the chunks of notes
+    :rtype: generator
+    """
+
+    leftover = ""
+    while True:
+        data = file_object.read(chunk_size)
+        if not data:
+            break
+        data = leftover + data.replace(",", " ")
+
+        # If the chunk does not end with a separator, its last note
+        # May be continued in the next chunk
+        notes = data.split()
+        leftover = notes.pop() if notes and not data[-1].isspace() else ""
+        if notes:
+            yield list(map(int, notes))
+
+    if leftover:
+        yield [int(leftover)]
+
+
+def find_number_of_transition_stream(chunks):
+    """
+    Function to find the number of transition required to group the wallet
+    When the notes are given as chunks, like from iterate_note_chunks
+    :param chunks: An iterable of the chunks of notes
+    :type chunks: iterable
+    :return: number_of_transition
+    :rtype: int
+    """
+
+    wallet = WalletStream()
+    for chunk in chunks:
+        wallet.update(chunk)
+
+    number_of_transition = wallet.number_of_transition
+    LOGGER.info("The number of transitions are: %s", number_of_transition)
+    return number_of_transition
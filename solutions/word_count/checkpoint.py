@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+""" Module for counting the words of a growing file incrementally
+
+The counts are saved to a JSON checkpoint along with the byte offset up to
+which they were counted, so that the next run reads only the bytes appended
+since. The offset is always just after a white space, a word which was cut off
+at the old end of the file is read again in the next run.
+
+The checkpoint also keeps the identity of the file: its inode and device, and
+a fingerprint of its first bytes. When the file was replaced (rotated), has
+become shorter than the offset (truncated), or was rewritten from the start,
+the counts are thrown away and the whole file is counted again.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * json - to read and write the checkpoint
+    * hashlib - to find the fingerprint of the file
+
+This script contains the following function
+    * get_file_identity - Finds the inode, device and fingerprint of a file
+    * is_count - Checks if a loaded value is a non negative integer
+    * is_valid_checkpoint - Checks if a loaded checkpoint has all its fields
+    * load_checkpoint - Loads a saved checkpoint
+    * save_checkpoint - Saves a checkpoint
+    * is_same_file - Checks if the checkpoint was made for the current file
+    * count_words_incremental - Counts the words of a file, starting from a checkpoint
+"""
+
+# Standard imports
+import hashlib
+import json
+import logging
+import os
+
+# User Imports
+from solutions.word_count.counter import update_word_count, ENCODING, ENCODING_ERRORS
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# The number of bytes at the start of the file which make its fingerprint
+FINGERPRINT_BYTES = 4096
+
+# The white spaces at which the counting may stop, none of them is a part of
+# A multi byte UTF-8 character
+WHITE_SPACES = b" \t\n\r\x0b\x0c"
+
+# The fields of a checkpoint and their types
+CHECKPOINT_FIELDS = {"inode": int, "device": int, "offset": int, "fingerprint": str,
+                     "fingerprint_length": int, "word_count": dict}
+
+
+def get_file_identity(file_object, fingerprint_length=FINGERPRINT_BYTES):
+    """
+    Function to find the identity of an opened file
+    :param file_object: The file opened for reading bytes
+    :type file_object: io.BufferedReader
+    :param fingerprint_length: The number of bytes at the start which are fingerprinted
+    :type fingerprint_length: int
+    :return: identity - The inode, device, size and fingerprint of the file
+    :rtype: dict
+    """
+    status = os.fstat(file_object.fileno())
+    file_object.seek(0)
+    start = file_object.read(fingerprint_length)
+    return {"inode": status.st_ino, "device": status.st_dev, "size": status.st_size,
+            "fingerprint": hashlib.sha1(start).hexdigest(), "fingerprint_length": len(start)}
+
+
+def is_count(value):
+    """
+    Function to check if a loaded value is a non negative integer, a boolean
+    is an int for isinstance, but is not a count
+    :param value: The loaded value
+    :type value: object
+    :return: True for a count
+    :rtype: bool
+    """
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def is_valid_checkpoint(checkpoint):
+    """
+    Function to check if a loaded checkpoint has all its fields with the
+    right types, and non negative counts and offsets
+    :param checkpoint: The loaded JSON
+    :type checkpoint: object
+    :return: True for a valid checkpoint
+    :rtype: bool
+    """
+
+    if not isinstance(checkpoint, dict):
+        return False
+    for field, field_type in CHECKPOINT_FIELDS.items():
+        value = checkpoint.get(field)
+        if field_type is int:
+            if not is_count(value):
+                return False
+        elif not isinstance(value, field_type):
+            return False
+    return all(map(is_count, checkpoint["word_count"].values()))
+
+
+def load_checkpoint(filepath):
+    """
+    Function to load a saved checkpoint
+    :param filepath: path of the checkpoint
+    :type filepath: str
+    :return: checkpoint, or None when there is no readable checkpoint
+    :rtype: dict
+    """
+    try:
+        with open(filepath) as file_object:
+            checkpoint = json.load(file_object)
+        if not is_valid_checkpoint(checkpoint):
+            raise ValueError("The checkpoint at {} is not valid".format(filepath))
+        return checkpoint
+    except (OSError, ValueError) as err:
+        LOGGER.info("No checkpoint loaded: %s", err)
+
+
+def save_checkpoint(filepath, checkpoint):
+    """
+    Function to save a checkpoint, the file is replaced in one step so that
+    a run which is stopped midway does not leave a broken checkpoint
+    :param filepath: path of the checkpoint
+    :type filepath: str
+    :param checkpoint: The checkpoint
+    :type checkpoint: dict
+    :return: Nothing
+    :rtype: None
+    """
+    temporary_path = filepath + ".tmp"
+    with open(temporary_path, "w") as file_object:
+        json.dump(checkpoint, file_object, separators=(",", ":"))
+    os.replace(temporary_path, filepath)
+
+
+def is_same_file(checkpoint, file_object):
+    """
+    Function to check if the checkpoint was made for the opened file, and
+    the file has only grown since
+    :param checkpoint: The checkpoint
+    :type checkpoint: dict
+    :param file_object: The file opened for reading bytes
+    :type file_object: io.BufferedReader
+    :return: True when the counting can continue from the checkpoint
+    :rtype: bool
+    """
+    identity = get_file_identity(file_object, checkpoint["fingerprint_length"])
+    if (identity["inode"], identity["device"]) != (checkpoint["inode"], checkpoint["device"]):
+        LOGGER.info("The file was replaced, counting it again")
+        return False
+    if identity["size"] < checkpoint["offset"]:
+        LOGGER.info("The file was truncated, counting it again")
+        return False
+    if identity["fingerprint"] != checkpoint["fingerprint"]:
+        LOGGER.info("The file was rewritten, counting it again")
+        return False
+    return True
+
+
+def count_words_incremental(filepath, checkpoint_path, chunk_size=1 << 20):
+    """
+    Function used to count the occurrences of all words in a file, reading
+    only the bytes after the offset of the checkpoint when it is for the
+    same file. The checkpoint is updated with the new counts
+    :param filepath: path of the file
+    :type filepath: str
+    :param checkpoint_path: path of the checkpoint
+    :type checkpoint_path: str
+    :param chunk_size: The number of bytes read at a time
+    :type chunk_size: int
+    :return: word_count - The count of every word, in the order they appeared
+    :rtype: dict
+    """
+
+    with open(filepath, "rb") as file_object:
+        checkpoint = load_checkpoint(checkpoint_path)
+        if checkpoint and is_same_file(checkpoint, file_object):
+            word_count = checkpoint["word_count"]
+            offset = checkpoint["offset"]
+        else:
+            word_count = dict()
+            offset = 0
+        LOGGER.info("Counting from byte %s", offset)
+
+        file_object.seek(offset)
+
+        # The bytes read since the last white space, kept in pieces so that a long
+        # Run without white spaces is joined only once
+        leftover = []
+        while True:
+            data = file_object.read(chunk_size)
+            if not data:
+                break
+
+            # The counting stops after the last white space, the word after it
+            # May be continued in the next chunk, or in the next run
+            end = max(map(data.rfind, WHITE_SPACES)) + 1
+            if not end:
+                leftover.append(data)
+                continue
+
+            text = b"".join(leftover) + data[:end]
+            update_word_count(word_count, text.decode(ENCODING, ENCODING_ERRORS))
+            offset += len(text)
+            leftover = [data[end:]]
+
+        identity = get_file_identity(file_object)
+
+    checkpoint = dict(identity, offset=offset, word_count=word_count)
+    save_checkpoint(checkpoint_path, checkpoint)
+
+    # The word at the end of the file is counted now, but not saved
+    update_word_count(word_count, b"".join(leftover).decode(ENCODING, ENCODING_ERRORS))
+
+    for word, count in word_count.items():
+        LOGGER.info("Word: %s   Count: %s", word, count)
+    return word_count
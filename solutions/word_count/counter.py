@@ -7,11 +7,18 @@ corresponding count. The output is expected in the form of a dictionary where
 the key represents the word and value represents the corresponding count. The
 keys should be in the same order as appeared in the input.
 
+A large input can be counted in chunks, so that only the counts are kept in
+memory and not the whole text or the list of all its words.
+
 This script requires the following modules be installed in the python environment
     * logging - to perform logging operations
 
 This script contains the following function
-    * check_for_piling - Checks if the rows of cube could be piled up vertically
+    * normalize_word - Gives the form of a word which is counted
+    * update_word_count - Adds the words of a piece of text to the counts
+    * count_words - Counts the occurrences of all words in a sentence
+    * iterate_text_chunks - Reads a file in chunks of text
+    * count_words_stream - Counts the occurrences of all words in chunks of text
 """
 
 # Standard imports
@@ -20,38 +27,119 @@ __author__ = "praveen@gyandata.com"
 
 LOGGER = logging.getLogger(__name__)
 
+# The encoding of the files which are counted, the bytes which cannot be
+# Decoded are replaced by U+FFFD, the same way whichever way the file is read
+ENCODING = "utf-8"
+ENCODING_ERRORS = "replace"
+
+
+def normalize_word(word):
+    """
+    Function to get the form of a word which is counted, every way of
+    counting takes the words through this function
+    :param word: The word as in the text
+    :type word: str
+    :return: word - in lower case, with any trailing comma or period stripped off
+    :rtype: str
+    """
+    return word.lower().rstrip(",.")
+
+
+def update_word_count(word_count, text):
+    """
+    Function to add the occurrences of the words in the text to word_count
+    :param word_count: The counts so far, in the order the words appeared
+    :type word_count: dict
+    :param text: The text having whole words
+    :type text: str
+    :return: Nothing
+    :rtype: None
+    """
+
+    for word in map(normalize_word, text.split()):
+        # The get method is used to get the value from dictionary
+        # and incremented by one if the key already exist
+        # If the key does not exist, then it returns the default value
+        # Of zero and then it is incremented by one
+        word_count[word] = word_count.get(word, 0) + 1
+
 
 def count_words(sentence):
     """
     Function used to count the occurrences of all words in a given sentence
     :param sentence: The sentence in which the occurrences need to be counted
     :type sentence: str
-    :return: Nothing
-    :rtype: None
+    :return: word_count - The count of every word, in the order they appeared
+    :rtype: dict
     """
     try:
         # Checking if the cubes is a list
         if not issubclass(type(sentence), str):
             raise ValueError("The sentence should be a string")
 
-        # Splitting the string into a list of words
-        words = sentence.split()
-
-        # Converting all the words to lower case and stripping of any trailing
-        # comma or period
-        words = list(map(lambda arg: (arg.lower()).rstrip(",."), words))
-
         word_count = dict()
-        for word in words:
-            # Looping over all the words
-
-            # The get method is used to get the value from dictionary
-            # and incremented by one if the key already exist
-            # If the key does not exist, then it returns the default value
-            # Of zero and then it is incremented by one
-            word_count[word] = word_count.get(word, 0) + 1
+        update_word_count(word_count, sentence)
 
         for word, count in word_count.items():
             LOGGER.info("Word: %s   Count: %s", word, count)
+        return word_count
     except ValueError as err:
         LOGGER.exception(err)
+
+
+def iterate_text_chunks(file_object, chunk_size=1 << 20):
+    """
+    Function to read a file in chunks of text which end between two words
+    A word split across two reads is joined back
+    :param file_object: The opened file, with ENCODING and ENCODING_ERRORS
+    :type file_object: io.TextIOBase
+    :param chunk_size: The number of characters read at a time
+    :type chunk_size: int
+    :return: A generator of the chunks of text
+    :rtype: generator
+    """
+
+    # The text read since the last white space, kept in pieces so that a long
+    # Run without white spaces is joined only once
+    leftover = []
+    while True:
+        data = file_object.read(chunk_size)
+        if not data:
+            break
+
+        # If the chunk does not end with a white space, its last word
+        # May be continued in the next chunk
+        if data[-1].isspace():
+            end = len(data)
+        else:
+            end = len(data) - len(data.rsplit(None, 1)[-1])
+        if not end:
+            leftover.append(data)
+            continue
+
+        yield "".join(leftover) + data[:end]
+        leftover = [data[end:]]
+
+    leftover = "".join(leftover)
+    if leftover:
+        yield leftover
+
+
+def count_words_stream(chunks):
+    """
+    Function used to count the occurrences of all words in chunks of text,
+    each chunk should end between two words, see iterate_text_chunks
+    The counts are the same as count_words on the whole text
+    :param chunks: The chunks of text
+    :type chunks: iterable
+    :return: word_count - The count of every word, in the order they appeared
+    :rtype: dict
+    """
+
+    word_count = dict()
+    for chunk in chunks:
+        update_word_count(word_count, chunk)
+
+    for word, count in word_count.items():
+        LOGGER.info("Word: %s   Count: %s", word, count)
+    return word_count
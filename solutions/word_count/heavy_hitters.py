@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+""" Module for finding the most frequent words with a fixed amount of memory
+
+The Space-Saving summary keeps the counts of at most a fixed number of words.
+A word which is not kept replaces the word with the smallest count, and takes
+over that count plus one, which is remembered as its error. Every kept count
+is then at least the true count and at most the true count plus its error,
+and any word which occurs more than (number of words / capacity) times is
+sure to be kept.
+
+The smallest count is found from a heap of the kept words. The counts are not
+updated in the heap as they grow, an entry popped with an old count is pushed
+back with the current count, so the heap stays as large as the summary.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * heapq - to find the word with the smallest count
+
+This script contains the following class and function
+    * SpaceSaving - The Space-Saving summary of a stream of words
+    * count_top_words_stream - Finds the most frequent words in chunks of text
+"""
+
+# Standard imports
+import heapq
+import logging
+
+# User Imports
+from solutions.word_count.counter import normalize_word
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SpaceSaving:
+    """
+    Class to keep the approximate counts of the most frequent words
+    """
+
+    def __init__(self, capacity):
+        """
+        :param capacity: The number of words whose counts are kept
+        :type capacity: int
+        """
+        if capacity < 1:
+            raise ValueError("The capacity should be at least one")
+        self.capacity = capacity
+        self.counts = dict()
+        self.errors = dict()
+        self.heap = []
+        self.number_of_words = 0
+
+    def __len__(self):
+        return len(self.counts)
+
+    def pop_smallest(self):
+        """
+        Function to remove the kept word with the smallest count
+        :return: The word and its count
+        :rtype: tuple
+        """
+        while True:
+            count, word = heapq.heappop(self.heap)
+            if self.counts[word] == count:
+                del self.counts[word]
+                del self.errors[word]
+                return word, count
+
+            # The count has grown since the entry was pushed
+            heapq.heappush(self.heap, (self.counts[word], word))
+
+    def add(self, word, count=1):
+        """
+        Function to add the occurrences of a word
+        :param word: The word
+        :type word: str
+        :param count: The number of occurrences
+        :type count: int
+        :return: Nothing
+        :rtype: None
+        """
+        self.number_of_words += count
+        if word in self.counts:
+            self.counts[word] += count
+            return
+
+        error = 0
+        if len(self.counts) >= self.capacity:
+            _, error = self.pop_smallest()
+        self.counts[word] = error + count
+        self.errors[word] = error
+        heapq.heappush(self.heap, (error + count, word))
+
+    def update(self, text):
+        """
+        Function to add the words in the text, the words are normalized the
+        same way as count_words does, see normalize_word
+        :param text: The text having whole words
+        :type text: str
+        :return: Nothing
+        :rtype: None
+        """
+        for word in map(normalize_word, text.split()):
+            self.add(word)
+
+    def get_top_words(self, top):
+        """
+        Function to get the words with the largest counts, with the bounds of
+        their true counts: count - error <= true count <= count
+        :param top: The number of words
+        :type top: int
+        :return: top_words - (word, count, error) of each word, largest count first
+        :rtype: list
+        """
+        top_words = heapq.nlargest(top, self.counts.items(), key=lambda arg: arg[1])
+        return [(word, count, self.errors[word]) for word, count in top_words]
+
+
+def count_top_words_stream(chunks, top, capacity):
+    """
+    Function to find the most frequent words in chunks of text, each chunk
+    should end between two words, see iterate_text_chunks
+    :param chunks: The chunks of text
+    :type chunks: iterable
+    :param top: The number of words to find
+    :type top: int
+    :param capacity: The number of words whose counts are kept, at least top
+    :type capacity: int
+    :return: top_words - (word, count, error) of each word, largest count first
+    :rtype: list
+    """
+
+    try:
+        summary = SpaceSaving(max(capacity, top))
+        for chunk in chunks:
+            summary.update(chunk)
+
+        top_words = summary.get_top_words(top)
+        for word, count, error in top_words:
+            LOGGER.info("Word: %s   Count: %s   Error: %s", word, count, error)
+        return top_words
+    except ValueError as err:
+        LOGGER.exception(err)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+""" Module for counting the occurrences of words in a file in parallel
+
+The file is memory mapped and split into ranges of bytes which end at a white
+space, so that no word is split between two ranges. Every range is counted in
+a process pool, and the partial counts are merged in the order of the ranges.
+Since the counts of a range keep the order in which its words first appeared,
+merging them in order keeps the order of the first appearance in the whole
+file, as given by count_words.
+
+The ranges are split only at ASCII white spaces, which are never part of a
+multi byte UTF-8 character, so every range is decoded on its own, with the
+same encoding as count_words_stream is given by main_word_count.
+
+This script requires the following modules be installed in the python environment
+    * logging - to perform logging operations
+    * concurrent - to count the ranges in parallel
+    * mmap - to map the file in memory
+
+This script contains the following function
+    * get_byte_ranges - Splits the file into ranges which end at a white space
+    * load_worker_file - Maps the file in memory in a pool worker
+    * count_range - Counts the occurrences of the words in a range of the file
+    * merge_word_count - Adds the partial counts of a range to the counts so far
+    * count_words_parallel - Counts the occurrences of all words of a file
+                             in a process pool
+"""
+
+# Standard imports
+import logging
+import mmap
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# User Imports
+from solutions.word_count.counter import update_word_count, ENCODING, ENCODING_ERRORS
+
+__author__ = "praveen@gyandata.com"
+
+LOGGER = logging.getLogger(__name__)
+
+# The memory mapped file of the current process
+WORKER_FILE = None
+
+# The white spaces at which the file may be split
+WHITE_SPACE = re.compile(rb"\s")
+
+
+def get_byte_ranges(mapped_file, range_bytes):
+    """
+    Function to split the file into ranges of about range_bytes each, every
+    range but the last one is extended up to the next white space
+    :param mapped_file: The memory mapped file
+    :type mapped_file: mmap.mmap
+    :param range_bytes: The size of a range in bytes
+    :type range_bytes: int
+    :return: ranges - The (start, end) bytes of each range
+    :rtype: list
+    """
+
+    ranges = []
+    start = 0
+    size = len(mapped_file)
+    while start < size:
+        match = WHITE_SPACE.search(mapped_file, min(start + range_bytes, size))
+        end = match.start() if match else size
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def load_worker_file(filepath):
+    """
+    Function run when a pool worker starts, to map the file in memory
+    :param filepath: path of the file
+    :type filepath: str
+    :return: Nothing
+    :rtype: None
+    """
+    global WORKER_FILE
+    with open(filepath, "rb") as file_object:
+        WORKER_FILE = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def count_range(byte_range, mapped_file=None):
+    """
+    Function to count the occurrences of the words in a range of the file
+    :param byte_range: The (start, end) bytes of the range
+    :type byte_range: tuple
+    :param mapped_file: The memory mapped file, the one mapped by the worker
+                        when it is not given
+    :type mapped_file: mmap.mmap
+    :return: word_count - The count of every word, in the order they appeared
+    :rtype: dict
+    """
+    start, end = byte_range
+    if mapped_file is None:
+        mapped_file = WORKER_FILE
+    word_count = dict()
+    update_word_count(word_count, mapped_file[start:end].decode(ENCODING, ENCODING_ERRORS))
+    return word_count
+
+
+def merge_word_count(word_count, partial_count):
+    """
+    Function to add the partial counts of a range to the counts so far, the
+    words which are new are added after the ones already seen
+    :param word_count: The counts of the ranges before this one
+    :type word_count: dict
+    :param partial_count: The counts of the range
+    :type partial_count: dict
+    :return: Nothing
+    :rtype: None
+    """
+    for word, count in partial_count.items():
+        word_count[word] = word_count.get(word, 0) + count
+
+
+def count_words_parallel(filepath, workers=1, range_bytes=1 << 26):
+    """
+    Function used to count the occurrences of all words in a file, with the
+    ranges counted in a process pool
+    :param filepath: path of the file
+    :type filepath: str
+    :param workers: The number of processes counting the ranges,
+                    with one the ranges are counted in this process
+    :type workers: int
+    :param range_bytes: The size of a range in bytes
+    :type range_bytes: int
+    :return: word_count - The count of every word, in the order they appeared
+    :rtype: dict
+    """
+
+    word_count = dict()
+    with open(filepath, "rb") as file_object:
+        # An empty file cannot be memory mapped, and has no words
+        if file_object.seek(0, 2):
+            with mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                ranges = get_byte_ranges(mapped_file, range_bytes)
+
+                # With one worker the ranges are counted from this mapping, which
+                # Is closed on return, the worker mapping is only for the pool
+                if workers <= 1:
+                    for byte_range in ranges:
+                        merge_word_count(word_count, count_range(byte_range, mapped_file))
+
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers, initializer=load_worker_file,
+                                         initargs=(filepath,)) as executor:
+                    # The partial counts are merged in the order of the ranges, and only a
+                    # Few ranges per worker are in flight, so that few of them wait in memory
+                    pending = deque()
+                    for byte_range in ranges:
+                        if len(pending) >= 2 * workers:
+                            merge_word_count(word_count, pending.popleft().result())
+                        pending.append(executor.submit(count_range, byte_range))
+                    while pending:
+                        merge_word_count(word_count, pending.popleft().result())
+
+    for word, count in word_count.items():
+        LOGGER.info("Word: %s   Count: %s", word, count)
+    return word_count